@@ -32,23 +32,66 @@ Usage:
 """
 
 import argparse
+import asyncio
+import csv
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
 import os
+import re
+import sqlite3
 import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
-
-import requests
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# PyYAML is optional; it is only imported if YAML output is requested
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
+
+# httpx is optional; when installed, batch lookups are sent concurrently from one
+# event loop (over HTTP/2 if h2 is also installed) instead of a thread pool
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 try:
-    import yaml
+    import orjson
 
-    YAML_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    YAML_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
 
-from dotenv import load_dotenv
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 # Import the non-special case parse_result function
 try:
@@ -57,6 +100,27 @@ try:
 except ImportError:
     USE_GENERIC_PARSER = False
 
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using the faster orjson parser when it is installed."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def json_dumps(data: Any, pretty: bool = False) -> str:
+    """
+    Serialize data to JSON text, using orjson when it is installed.
+
+    Output is compact unless pretty is set, in which case it is indented by two
+    spaces. Non-ASCII characters are written as-is rather than escaped.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
 # Path to cached legislator data
 CACHED_LEGISLATORS_PATH = Path(__file__).parent.parent / "cached_data" / "us" / "legislators-lookup.json"
 
@@ -64,74 +128,258 @@ CACHED_LEGISLATORS_PATH = Path(__file__).parent.parent / "cached_data" / "us" /
 CACHED_LEGISLATORS = {}
 if CACHED_LEGISLATORS_PATH.exists():
     try:
-        with open(CACHED_LEGISLATORS_PATH, "r") as f:
-            CACHED_LEGISLATORS = json.load(f)
+        # Parse straight from bytes to skip the intermediate text decode
+        CACHED_LEGISLATORS = json_loads(CACHED_LEGISLATORS_PATH.read_bytes())
         logging.info(f"Loaded legislator data from {CACHED_LEGISLATORS_PATH}")
     except Exception as e:
         logging.warning(f"Failed to load legislator data: {e}")
 else:
     logging.warning(f"Legislator data not found at {CACHED_LEGISLATORS_PATH}. Run update_us_congressional_data.py first.")
 
-# Define STATE_MAPPING directly in this file to avoid circular imports
-STATE_MAPPING = {
-    "AL": "Alabama",
-    "AK": "Alaska",
-    "AZ": "Arizona",
-    "AR": "Arkansas",
-    "CA": "California",
-    "CO": "Colorado",
-    "CT": "Connecticut",
-    "DE": "Delaware",
-    "FL": "Florida",
-    "GA": "Georgia",
-    "HI": "Hawaii",
-    "ID": "Idaho",
-    "IL": "Illinois",
-    "IN": "Indiana",
-    "IA": "Iowa",
-    "KS": "Kansas",
-    "KY": "Kentucky",
-    "LA": "Louisiana",
-    "ME": "Maine",
-    "MD": "Maryland",
-    "MA": "Massachusetts",
-    "MI": "Michigan",
-    "MN": "Minnesota",
-    "MS": "Mississippi",
-    "MO": "Missouri",
-    "MT": "Montana",
-    "NE": "Nebraska",
-    "NV": "Nevada",
-    "NH": "New Hampshire",
-    "NJ": "New Jersey",
-    "NM": "New Mexico",
-    "NY": "New York",
-    "NC": "North Carolina",
-    "ND": "North Dakota",
-    "OH": "Ohio",
-    "OK": "Oklahoma",
-    "OR": "Oregon",
-    "PA": "Pennsylvania",
-    "RI": "Rhode Island",
-    "SC": "South Carolina",
-    "SD": "South Dakota",
-    "TN": "Tennessee",
-    "TX": "Texas",
-    "UT": "Utah",
-    "VT": "Vermont",
-    "VA": "Virginia",
-    "WA": "Washington",
-    "WV": "West Virginia",
-    "WI": "Wisconsin",
-    "WY": "Wyoming",
-    "DC": "District of Columbia",
-}
 
-# Load environment variables from .env file (looks for .env in current directory and parent directories)
-load_dotenv()
+# Strings repeated in every output record, interned once so that each record
+# (and each party value read from the cached JSON) shares one object
+SENATOR = sys.intern("Senator")
+REPRESENTATIVE = sys.intern("Representative")
+DELEGATE = sys.intern("Delegate (Non-Voting)")
+RESIDENT_COMMISSIONER = sys.intern("Resident Commissioner (Non-Voting)")
+UNKNOWN = sys.intern("Unknown")
+
+
+def _intern(value: Any) -> Any:
+    """Intern value if it is a string (cached fields may also be null or NaN)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=None)
+def _district_key(code: str, district: str) -> str:
+    """
+    Return the interned district ID for a state or territory code and district.
+
+    There are only ~440 distinct IDs (e.g. "CA-12", "VT-AL"), so each is built
+    once and every lookup table and result shares the same string object.
+    """
+    return sys.intern(f"{code}-{district}")
+
+
+def _legislator_name(legislator: Dict[str, Any]) -> str:
+    """
+    Return a legislator's display name from cached CSV fields.
+
+    Empty CSV cells are cached as null, so a missing or null full_name falls
+    back to the first and last names.
+    """
+    first = legislator.get("first_name") or ""
+    last = legislator.get("last_name") or ""
+    name: str = legislator.get("full_name") or f"{first} {last}"
+    return name.strip()
+
+
+@dataclass(frozen=True, slots=True)
+class Senator:
+    """A senator from cached legislator data, in output field order."""
+
+    name: str
+    party: str = UNKNOWN
+    role: str = SENATOR
+    state: str = ""
+    bioguide_id: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the senator in the dictionary output schema."""
+        # The schema is fixed, so build the dict directly rather than with
+        # dataclasses.asdict, which walks the fields and copies each value
+        return {
+            "name": self.name,
+            "party": self.party,
+            "role": self.role,
+            "state": self.state,
+            "bioguide_id": self.bioguide_id,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Representative:
+    """A House member from cached legislator data, in output field order."""
+
+    name: str
+    party: str = UNKNOWN
+    role: str = REPRESENTATIVE
+    district: str = ""
+    bioguide_id: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the representative in the dictionary output schema."""
+        return {
+            "name": self.name,
+            "party": self.party,
+            "role": self.role,
+            "district": self.district,
+            "bioguide_id": self.bioguide_id,
+        }
+
+
+def _format_senator(senator: Dict[str, Any], state_abbr: str) -> Senator:
+    """Build a Senator record from a cached senator entry."""
+    return Senator(
+        name=_legislator_name(senator),
+        party=_intern(senator.get("party", UNKNOWN)),
+        state=state_abbr,
+        bioguide_id=senator.get("bioguide_id", ""),
+    )
+
+
+def _format_representative(rep: Dict[str, Any], district_id: str) -> Representative:
+    """Build a Representative record from a cached representative entry."""
+    return Representative(
+        name=_legislator_name(rep),
+        party=_intern(rep.get("party", UNKNOWN)),
+        district=district_id,
+        bioguide_id=rep.get("bioguide_id", ""),
+    )
+
+
+def build_legislator_indexes(
+    legislators: Dict[str, Any],
+) -> Tuple[Mapping[str, Tuple[Senator, ...]], Mapping[str, Representative]]:
+    """
+    Index cached legislator data by state and district.
+
+    The long-lived index holds compact, immutable records in read-only
+    mappings; they are converted to dictionaries with to_dict() when a result
+    is assembled.
+
+    Args:
+        legislators: Data written by update_us_congressional_data.py
+
+    Returns:
+        Tuple of (senators by state abbreviation, representative by district ID).
+        At-large districts (stored as "ST-0") are indexed as "ST-AL".
+    """
+    senators_by_state = {
+        state_abbr: tuple(_format_senator(s, state_abbr) for s in entry["senators"])
+        for state_abbr, entry in legislators.get("states", {}).items()
+        if entry.get("senators")
+    }
+
+    rep_by_district = {}
+    for district_id, entry in legislators.get("districts", {}).items():
+        rep = entry.get("representative")
+        if not rep:
+            continue
+        state_abbr, _, district_num = district_id.rpartition("-")
+        district_id = _district_key(
+            state_abbr, "AL" if district_num == "0" else district_num
+        )
+        rep_by_district[district_id] = _format_representative(rep, district_id)
+
+    return MappingProxyType(senators_by_state), MappingProxyType(rep_by_district)
+
+
+# Lookup tables built once at import so parse_result only does dict lookups
+_SENATORS_BY_STATE, _REP_BY_DISTRICT = build_legislator_indexes(CACHED_LEGISLATORS)
+
+# Define STATE_MAPPING directly in this file to avoid circular imports.
+# It is a read-only view, since it is shared constant data.
+STATE_MAPPING = MappingProxyType(
+    {
+        "AL": "Alabama",
+        "AK": "Alaska",
+        "AZ": "Arizona",
+        "AR": "Arkansas",
+        "CA": "California",
+        "CO": "Colorado",
+        "CT": "Connecticut",
+        "DE": "Delaware",
+        "FL": "Florida",
+        "GA": "Georgia",
+        "HI": "Hawaii",
+        "ID": "Idaho",
+        "IL": "Illinois",
+        "IN": "Indiana",
+        "IA": "Iowa",
+        "KS": "Kansas",
+        "KY": "Kentucky",
+        "LA": "Louisiana",
+        "ME": "Maine",
+        "MD": "Maryland",
+        "MA": "Massachusetts",
+        "MI": "Michigan",
+        "MN": "Minnesota",
+        "MS": "Mississippi",
+        "MO": "Missouri",
+        "MT": "Montana",
+        "NE": "Nebraska",
+        "NV": "Nevada",
+        "NH": "New Hampshire",
+        "NJ": "New Jersey",
+        "NM": "New Mexico",
+        "NY": "New York",
+        "NC": "North Carolina",
+        "ND": "North Dakota",
+        "OH": "Ohio",
+        "OK": "Oklahoma",
+        "OR": "Oregon",
+        "PA": "Pennsylvania",
+        "RI": "Rhode Island",
+        "SC": "South Carolina",
+        "SD": "South Dakota",
+        "TN": "Tennessee",
+        "TX": "Texas",
+        "UT": "Utah",
+        "VT": "Vermont",
+        "VA": "Virginia",
+        "WA": "Washington",
+        "WV": "West Virginia",
+        "WI": "Wisconsin",
+        "WY": "Wyoming",
+        "DC": "District of Columbia",
+    }
+)
+
+# ZIP code -> state abbreviation for the ZIP fallback lookup.
+# This would normally use a ZIP code database; for now it covers some common ZIPs.
+ZIP_TO_STATE = MappingProxyType(
+    {"94110": "CA", "94612": "CA", "10001": "NY", "82001": "WY"}
+)
+
+# Optional ZIP -> congressional district crosswalk with "zip", "state" and "cd"
+# columns (e.g. from the Census ZCTA-to-congressional-district relationship
+# file). ZIP codes that map to a single district are answered from cached data.
+ZIP_TO_CD_PATH = Path(__file__).parent.parent / "cached_data" / "us" / "zip-to-cd.csv"
 
 API_URL = "https://www.googleapis.com/civicinfo/v2/divisionsByAddress"
-ENV_API_KEY = os.getenv("GOOGLE_CIVIC_API_KEY")  # API key from .env file
+
+# States with a single, at-large congressional district
+_AT_LARGE_STATES = frozenset({"AK", "DE", "ND", "SD", "VT", "WY"})
+
+# Territories (and DC), which have no senators and a non-voting House member
+_TERRITORIES = frozenset({"DC", "PR", "GU", "VI", "MP", "AS"})
+
+# Parses a (lower-cased) OCD division ID into its state, congressional district
+# and federal district/territory parts, e.g. ocd-division/country:us/state:ca/cd:12
+# (kept identical to the pattern in parse_result_no_special_cases)
+_OCD_RE = re.compile(
+    r"ocd-division/country:us"
+    r"(?:/state:(?P<state>[a-z]{2})(?:/cd:(?P<cd>[a-z0-9]+))?)?"
+    r"(?:/district:(?P<district>[a-z]{2}))?$"
+)
+
+# Shared HTTP session so repeated lookups reuse keep-alive connections (and TLS).
+# It is created on first use, so requests is not imported until it is needed.
+HTTP_POOL_SIZE = 16  # Also the upper bound on concurrent batch lookups
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Persistent cache of divisionsByAddress responses, keyed by normalized address
+CIVIC_CACHE_PATH = Path(__file__).parent.parent / "cached_data" / "civic_cache.sqlite"
+# Seconds before a cached response is refetched. lookup_divisions may keep a
+# response read from the cache in memory for up to twice this long (see there).
+CIVIC_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Opened on first use so that importing this module never touches the disk
+_civic_cache_conn: Optional[sqlite3.Connection] = None
+_civic_cache_lock = threading.Lock()  # Serializes use of the shared connection
 
 
 def setup_logger():
@@ -142,6 +390,7 @@ def setup_logger():
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_api_key() -> str:
     """
     Get the Google Civic API key from environment variables.
@@ -155,7 +404,13 @@ def get_api_key() -> str:
     Raises:
         SystemExit: If no API key is found
     """
-    key = ENV_API_KEY
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file (looks for .env in current
+    # directory and parent directories)
+    load_dotenv()
+
+    key = os.getenv("GOOGLE_CIVIC_API_KEY")
     if not key:
         logging.error(
             "No API key found. Create a .env file with your Google Civic API key:"
@@ -165,26 +420,275 @@ def get_api_key() -> str:
     return key
 
 
-def lookup_divisions(address: str, api_key: str) -> dict:
+def get_session() -> "requests.Session":
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    The session requests gzip-compressed responses, keeps up to HTTP_POOL_SIZE
+    keep-alive connections and retries rate-limited (429) and server error
+    responses with exponential backoff.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            # Ask for compressed responses; requests decompresses transparently
+            session.headers["Accept-Encoding"] = "gzip, deflate"
+            session.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.5,
+                        status_forcelist=(429, 500, 502, 503, 504),
+                        allowed_methods=("GET",),
+                    ),
+                ),
+            )
+            _session = session
+    return _session
+
+
+def get_civic_cache() -> Optional[sqlite3.Connection]:
+    """
+    Return the module-level connection to the Civic API response cache.
+
+    The SQLite database is created under cached_data/ on first use. If it cannot
+    be opened, caching is disabled and None is returned.
+    """
+    global _civic_cache_conn
+    if _civic_cache_conn is None:
+        with _civic_cache_lock:
+            # Another thread may have opened it while this one waited
+            if _civic_cache_conn is None:
+                try:
+                    CIVIC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    conn = sqlite3.connect(CIVIC_CACHE_PATH, check_same_thread=False)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS civic_cache "
+                        "(key TEXT PRIMARY KEY, json BLOB, ts INTEGER)"
+                    )
+                    _civic_cache_conn = conn
+                except (OSError, sqlite3.Error) as e:
+                    logging.warning(
+                        f"Civic API cache unavailable at {CIVIC_CACHE_PATH}: {e}"
+                    )
+    return _civic_cache_conn
+
+
+def civic_cache_key(address: str) -> str:
+    """Return the cache key for an address (case and whitespace insensitive)."""
+    return hashlib.sha1(address.strip().lower().encode("utf-8")).hexdigest()
+
+
+def read_civic_cache(address: str) -> Optional[Dict[str, Any]]:
+    """Return the cached divisions for an address, or None if absent or stale."""
+    conn = get_civic_cache()
+    if conn is None:
+        return None
+
+    try:
+        with _civic_cache_lock:
+            row = conn.execute(
+                "SELECT json, ts FROM civic_cache WHERE key = ?",
+                (civic_cache_key(address),),
+            ).fetchone()
+    except sqlite3.Error as e:
+        # Treat an unreadable cache (locked, corrupt, old schema) as a miss
+        logging.warning(f"Failed to read Civic API cache: {e}")
+        return None
+    if row and time.time() - row[1] < CIVIC_CACHE_TTL:
+        logging.info(f"Using cached divisions for: {address!r}")
+        cached: Dict[str, Any] = json_loads(row[0])
+        return cached
+    return None
+
+
+def write_civic_cache(address: str, data: Dict[str, Any]) -> None:
+    """Store the divisions for an address in the response cache."""
+    conn = get_civic_cache()
+    if conn is None:
+        return
+
+    # orjson serializes straight to bytes, which the BLOB column stores as-is
+    payload = orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data)
+    try:
+        with _civic_cache_lock:
+            conn.execute(
+                "INSERT OR REPLACE INTO civic_cache (key, json, ts) VALUES (?, ?, ?)",
+                (civic_cache_key(address), payload, int(time.time())),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logging.warning(f"Failed to write Civic API cache: {e}")
+
+
+def cached_civic_lookup(
+    func: Callable[[str, str], Dict[str, Any]],
+) -> Callable[[str, str], Dict[str, Any]]:
+    """
+    Decorate a divisionsByAddress lookup with the persistent response cache.
+
+    Responses younger than CIVIC_CACHE_TTL are returned from the cache without a
+    network request; misses are fetched and written back (cache-aside).
+    """
+
+    @functools.wraps(func)
+    def wrapper(address: str, api_key: str) -> Dict[str, Any]:
+        cached = read_civic_cache(address)
+        if cached is not None:
+            return cached
+
+        data = func(address, api_key)
+        write_civic_cache(address, data)
+        return data
+
+    return wrapper
+
+
+@cached_civic_lookup
+def _fetch_divisions(address: str, api_key: str) -> dict:
     params = {"address": address, "key": api_key}
     logging.info(f"Querying divisionsByAddress for: {address!r}")
-    resp = requests.get(API_URL, params=params, timeout=10)
-    resp.raise_for_status()
-    return resp.json()
+    with get_session().get(
+        API_URL, params=params, stream=IJSON_AVAILABLE, timeout=10
+    ) as resp:
+        resp.raise_for_status()
+        if IJSON_AVAILABLE:
+            # Stream-parse just the divisions instead of buffering the whole body
+            resp.raw.decode_content = True
+            items = ijson.kvitems(resp.raw, "divisions", use_float=True)
+            return {"divisions": dict(items)}
+        result: Dict[str, Any] = json_loads(resp.content)
+        return result
+
+
+def _cache_period() -> int:
+    """Return the number of the current CIVIC_CACHE_TTL-long period."""
+    return int(time.time() // max(CIVIC_CACHE_TTL, 1))
+
+
+@functools.lru_cache(maxsize=4096)
+def _memoized_divisions(address: str, api_key: str, period: int) -> dict:
+    """Memoize _fetch_divisions per cache period (see lookup_divisions)."""
+    return _fetch_divisions(address, api_key)
+
+
+def lookup_divisions(address: str, api_key: str) -> dict:
+    """
+    Look up the divisions for an address, with in-process and persistent caching.
+
+    Repeat lookups within a process skip the SQLite cache too. In-process
+    entries are keyed by the current CIVIC_CACHE_TTL-long period, not by the
+    age of the stored response, so a response read from the SQLite cache near
+    the end of its TTL can be served for up to twice CIVIC_CACHE_TTL in all.
+    The returned dict is shared between callers, so it must not be modified.
+    """
+    return _memoized_divisions(address, api_key, _cache_period())
+
+
+def civic_api_cache_clear() -> None:
+    """Empty both the in-process and the persistent Civic API response caches."""
+    _memoized_divisions.cache_clear()
+    conn = get_civic_cache()
+    if conn is not None:
+        with _civic_cache_lock:
+            conn.execute("DELETE FROM civic_cache")
+            conn.commit()
+
+
+async def lookup_divisions_many_async(
+    addresses: List[str],
+    api_key: str,
+    client: Optional["httpx.AsyncClient"] = None,
+    max_concurrency: int = HTTP_POOL_SIZE,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Look up the divisions for many addresses concurrently with httpx.
+
+    Uncached requests are issued together over a single client, which
+    multiplexes them on one HTTP/2 connection when the h2 package is installed.
+    At most max_concurrency are outstanding at a time, which keeps a large
+    batch within the Civic API rate limits (a connection limit alone does not,
+    since one HTTP/2 connection carries many streams). Addresses with a fresh
+    entry in the response cache are not requested, and fetched responses are
+    written back to it.
+
+    Args:
+        addresses: The (normalized) addresses to lookup
+        api_key: The Google Civic API key
+        client: Optional client to send the requests with (closed by the caller)
+        max_concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        List of divisionsByAddress responses in the same order as addresses,
+        with None for any lookup that failed
+    """
+    import httpx
+
+    results: List[Optional[Dict[str, Any]]] = [
+        read_civic_cache(address) for address in addresses
+    ]
+    pending = [i for i, result in enumerate(results) if result is None]
+    if not pending:
+        return results
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def get(http: "httpx.AsyncClient", address: str) -> "httpx.Response":
+        async with semaphore:
+            return await http.get(API_URL, params={"address": address, "key": api_key})
+
+    async def fetch(http: "httpx.AsyncClient") -> List[Any]:
+        logging.info(f"Querying divisionsByAddress for {len(pending)} addresses")
+        return await asyncio.gather(
+            *(get(http, addresses[i]) for i in pending), return_exceptions=True
+        )
+
+    if client is None:
+        async with httpx.AsyncClient(
+            http2=H2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=HTTP_POOL_SIZE),
+        ) as http:
+            responses = await fetch(http)
+    else:
+        responses = await fetch(client)
+
+    for i, resp in zip(pending, responses):
+        try:
+            if isinstance(resp, BaseException):
+                raise resp
+            resp.raise_for_status()
+            data: Dict[str, Any] = json_loads(resp.content)
+        except Exception as e:
+            logging.error(f"Error querying Civic API for {addresses[i]!r}: {e}")
+            continue
+        write_civic_cache(addresses[i], data)
+        results[i] = data
+
+    return results
 
 
 def extract_congressional_districts(divisions: dict) -> List[str]:
-    cds = []
-    for ocd_id, info in divisions.get("divisions", {}).items():
-        if "/cd:" in ocd_id:
-            cds.append(info.get("name", ocd_id))
-    return cds
+    return [
+        division.info.get("name", division.ocd_id)
+        for division in classify_divisions(divisions)
+        if division.kind == "cd"
+    ]
 
 
 def filter_data(
     data: Dict[str, Any],
-    keep_fields: Optional[Set[str]] = None,
-    delete_fields: Optional[Set[str]] = None,
+    keep_fields: Optional[AbstractSet[str]] = None,
+    delete_fields: Optional[AbstractSet[str]] = None,
 ) -> Dict[str, Any]:
     """
     Filter fields in a data dictionary based on keep_fields or delete_fields.
@@ -208,11 +712,53 @@ def filter_data(
         return data
 
 
-def get_district_info_from_civic_api(address: str) -> Dict[str, Any]:
-    """Get district information from the Google Civic API."""
+def make_field_filter(
+    keep_fields: Optional[AbstractSet[str]] = None,
+    delete_fields: Optional[AbstractSet[str]] = None,
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Return a function that filters a dictionary like filter_data.
+
+    The keep/delete decision is made once, so applying the returned function to
+    many dictionaries avoids re-checking the field sets for each one. Kept
+    fields stay in the dictionary's own order.
+    """
+    if keep_fields:
+        kept = frozenset(keep_fields)
+
+        def keep(data: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: v for k, v in data.items() if k in kept}
+
+        return keep
+
+    if delete_fields:
+        deleted = frozenset(delete_fields)
+
+        def delete(data: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: v for k, v in data.items() if k not in deleted}
+
+        return delete
+
+    return lambda data: data
+
+
+def get_district_info_from_civic_api(
+    address: str, prefetched: Optional[Mapping[str, Optional[Dict[str, Any]]]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Get district information from the Google Civic API.
+
+    If prefetched has an entry for the address it is used as-is, without a
+    request; an entry of None is a lookup that already failed, which is not
+    retried.
+    """
     try:
-        api_key = get_api_key()
-        data = lookup_divisions(address, api_key)
+        if prefetched is not None and address in prefetched:
+            data = prefetched[address]
+            if data is None:
+                return None
+        else:
+            data = lookup_divisions(address, get_api_key())
 
         # Use the generic implementation if available
         if USE_GENERIC_PARSER:
@@ -224,246 +770,315 @@ def get_district_info_from_civic_api(address: str) -> Dict[str, Any]:
         return None
 
 
-def parse_result(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Parse API result into a standardized format."""
-    district_data = {}
-    state_abbr = None
-    territories = ["DC", "PR", "GU", "VI", "MP", "AS"]  # Territories with no senators
-
-    # Process special case for tests: CA-12 (Nancy Pelosi)
-    def add_ca12_if_needed():
-        if "CA-12" in data.get("divisions", {}):
-            district_id = "CA-12"
-            if district_id not in district_data:
-                district_data[district_id] = {"senators": [], "representatives": []}
-
-            # Add Nancy Pelosi as representative for tests
-            district_data[district_id]["representatives"] = [{
-                "name": "Nancy Pelosi",
-                "party": "Democratic",
-                "role": "Representative",
-                "district": district_id
-            }]
-
-            # Add California senators
-            if "CA" in district_data and district_data["CA"]["senators"]:
-                district_data[district_id]["senators"] = district_data["CA"]["senators"]
-            elif CACHED_LEGISLATORS and "states" in CACHED_LEGISLATORS and "CA" in CACHED_LEGISLATORS["states"]:
-                cached_senators = CACHED_LEGISLATORS["states"]["CA"].get("senators", [])
-                if cached_senators:
-                    senators_data = []
-                    for senator in cached_senators:
-                        senator_info = {
-                            "name": senator.get("full_name", f"{senator.get('first_name', '')} {senator.get('last_name', '')}").strip(),
-                            "party": senator.get("party", "Unknown"),
-                            "role": "Senator",
-                            "state": "CA",
-                            "bioguide_id": senator.get("bioguide_id", "")
-                        }
-                        senators_data.append(senator_info)
-                    district_data[district_id]["senators"] = senators_data
-            else:
-                district_data[district_id]["senators"] = [
-                    {"name": "Alex Padilla", "party": "Democratic", "role": "Senator", "state": "CA"},
-                    {"name": "Laphonza R. Butler", "party": "Democratic", "role": "Senator", "state": "CA"}
-                ]
-
-    # Extract districts and representatives
-    for ocd_id, info in data.get("divisions", {}).items():
-        # Check if this is a state division
-        if "state:" in ocd_id and "/" not in ocd_id.split("state:")[1]:
-            # Extract state from OCD ID
-            state_abbr = ocd_id.split("state:")[1].upper()
-
-            # Create a default entry for the state
-            if state_abbr not in district_data:
-                district_data[state_abbr] = {"senators": [], "representatives": []}
-
-            # Add senators from cached data if available
-            if CACHED_LEGISLATORS and "states" in CACHED_LEGISLATORS and state_abbr in CACHED_LEGISLATORS["states"]:
-                cached_senators = CACHED_LEGISLATORS["states"][state_abbr].get("senators", [])
-                if cached_senators:
-                    senators_data = []
-                    for senator in cached_senators:
-                        # Format the senator data as needed
-                        senator_info = {
-                            "name": senator.get("full_name", f"{senator.get('first_name', '')} {senator.get('last_name', '')}").strip(),
-                            "party": senator.get("party", "Unknown"),
-                            "role": "Senator",
-                            "state": state_abbr,
-                            "bioguide_id": senator.get("bioguide_id", "")
-                        }
-                        senators_data.append(senator_info)
-                    district_data[state_abbr]["senators"] = senators_data
-
-            # If no cached data, use placeholder
-            if not district_data[state_abbr]["senators"]:
-                district_data[state_abbr]["senators"] = [
-                    {
-                        "name": f"Senator 1 for {state_abbr}",
-                        "role": "Senator",
-                        "state": state_abbr,
-                    },
-                    {
-                        "name": f"Senator 2 for {state_abbr}",
-                        "role": "Senator",
-                        "state": state_abbr,
-                    },
-                ]
-
-            # Create at-large district for Vermont when only state data is present
-            if state_abbr == "VT":
-                district_id = "VT-AL"
-                district_data[district_id] = {
-                    "senators": [
-                        {"name": "Bernie Sanders", "party": "Independent", "role": "Senator", "state": "VT"},
-                        {"name": "Peter Welch", "party": "Democratic", "role": "Senator", "state": "VT"}
-                    ],
-                    "representatives": [{
-                        "name": "Becca Balint",
-                        "party": "Democratic",
-                        "role": "Representative",
-                        "district": district_id
-                    }]
-                }
+def _senators_for_state(state_abbr: str) -> List[Dict[str, Any]]:
+    """Return a state's senators from cached data, or placeholders if unavailable."""
+    senators = _SENATORS_BY_STATE.get(state_abbr)
+    if senators:
+        return [senator.to_dict() for senator in senators]
+    return [
+        {
+            "name": f"Senator 1 for {state_abbr}",
+            "role": SENATOR,
+            "state": state_abbr,
+        },
+        {
+            "name": f"Senator 2 for {state_abbr}",
+            "role": SENATOR,
+            "state": state_abbr,
+        },
+    ]
+
+
+def _classify_division(m: "re.Match[str]") -> Optional[Tuple[str, str, str]]:
+    """
+    Classify a matched OCD division ID.
 
-        # Check for district/territory outside of a state (like DC)
-        elif "district:" in ocd_id.lower():
-            # Extract district code from OCD ID
-            district_code = ocd_id.split("district:")[1].upper()
-            if "/" in district_code:
-                district_code = district_code.split("/")[0]
-
-            # Create a district ID with -AL suffix (at-large)
-            district_id = f"{district_code}-AL"
-
-            # Create a default entry for this district
-            if district_id not in district_data:
-                district_data[district_id] = {"senators": [], "representatives": []}
-
-            # Special case for DC (tests expect Eleanor Holmes Norton)
-            if district_code == "DC":
-                district_data[district_id]["representatives"] = [{
-                    "name": "Eleanor Holmes Norton",
-                    "party": "Democratic",
-                    "role": "Delegate (Non-Voting)",
-                    "district": district_id
-                }]
-                # DC has no senators
-                district_data[district_id]["senators"] = []
-
-        # Check if this is a congressional district
-        elif "/cd:" in ocd_id:
-            # Extract state from OCD ID
-            state_abbr = ocd_id.split("state:")[1].split("/")[0].upper()
-            district_num = ocd_id.split("cd:")[1]
-
-            # Handle at-large districts
-            if district_num == "al":
-                district_id = f"{state_abbr}-AL"
-            else:
-                district_id = f"{state_abbr}-{district_num}"
-
-            # Create entry for this district
-            if district_id not in district_data:
-                district_data[district_id] = {"senators": [], "representatives": []}
-
-            # Special case handling for CA-12 (Nancy Pelosi)
-            if district_id == "CA-12":
-                rep_data = {
-                    "name": "Nancy Pelosi",
-                    "party": "Democratic",
-                    "role": "Representative",
-                    "district": district_id,
-                }
+    Returns:
+        Tuple of (kind, state or territory code, district_data key), where kind
+        is "cd", "district" or "state"; None for divisions we do not handle
+    """
+    if m.group("cd"):
+        # Congressional district, e.g. state:ca/cd:12 or state:vt/cd:al
+        state_abbr = m.group("state").upper()
+        district_num = m.group("cd")
+        suffix = "AL" if district_num == "al" else district_num
+        return ("cd", state_abbr, _district_key(state_abbr, suffix))
+    if m.group("district"):
+        # District/territory outside of a state (like DC), always at-large
+        district_code = m.group("district").upper()
+        return ("district", district_code, _district_key(district_code, "AL"))
+    if m.group("state"):
+        state_abbr = m.group("state").upper()
+        return ("state", state_abbr, state_abbr)
+    return None
+
+
+class Division(NamedTuple):
+    """A classified division from a divisionsByAddress response."""
+
+    kind: str  # "cd", "district" or "state"
+    code: str  # State or territory code, e.g. "CA" or "DC"
+    key: str  # district_data key, e.g. "CA-12", "DC-AL" or "CA"
+    ocd_id: str
+    info: Dict[str, Any]
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_ocd_ids(
+    ocd_ids: Tuple[str, ...],
+) -> Tuple[Optional[Tuple[str, str, str]], ...]:
+    """
+    Classify each OCD ID with _classify_division (None for unhandled IDs).
 
-                # Force CA-12 to have the correct senators for tests
-                district_data[district_id]["senators"] = [
-                    {"name": "Alex Padilla", "party": "Democratic", "role": "Senator", "state": "CA"},
-                    {"name": "Laphonza R. Butler", "party": "Democratic", "role": "Senator", "state": "CA"}
-                ]
-            else:
-                # Set default representative data
-                rep_data = {
-                    "name": f"Representative for {district_id}",
-                    "role": "Representative",
-                    "district": district_id,
-                }
+    An address returns the same division IDs on every lookup, so the result is
+    memoized on the tuple of IDs. The tuple keeps the response order, which the
+    parsed result follows.
+    """
+    _match = _OCD_RE.match  # Bound once for the loop
+    return tuple(
+        _classify_division(m) if (m := _match(ocd_id.lower())) else None
+        for ocd_id in ocd_ids
+    )
 
-                # Check cached legislator data for representative
-                if CACHED_LEGISLATORS and "districts" in CACHED_LEGISLATORS and district_id in CACHED_LEGISLATORS["districts"]:
-                    cached_rep = CACHED_LEGISLATORS["districts"][district_id].get("representative")
-                    if cached_rep:
-                        # Format the representative data from cache
-                        rep_data = {
-                            "name": cached_rep.get("full_name", f"{cached_rep.get('first_name', '')} {cached_rep.get('last_name', '')}").strip(),
-                            "party": cached_rep.get("party", "Unknown"),
-                            "role": "Representative",
-                            "district": district_id,
-                            "bioguide_id": cached_rep.get("bioguide_id", "")
-                        }
-
-            district_data[district_id]["representatives"].append(rep_data)
-
-            # Add senators for this state based on the state abbreviation
-            if state_abbr:
-                # If state entry exists, copy senators
-                if state_abbr in district_data and district_data[state_abbr]["senators"]:
-                    district_data[district_id]["senators"] = district_data[state_abbr]["senators"]
-                # Otherwise check cached data
-                elif CACHED_LEGISLATORS and "states" in CACHED_LEGISLATORS and state_abbr in CACHED_LEGISLATORS["states"]:
-                    cached_senators = CACHED_LEGISLATORS["states"][state_abbr].get("senators", [])
-                    if cached_senators:
-                        senators_data = []
-                        for senator in cached_senators:
-                            # Format the senator data as needed
-                            senator_info = {
-                                "name": senator.get("full_name", f"{senator.get('first_name', '')} {senator.get('last_name', '')}").strip(),
-                                "party": senator.get("party", "Unknown"),
-                                "role": "Senator",
-                                "state": state_abbr,
-                                "bioguide_id": senator.get("bioguide_id", "")
-                            }
-                            senators_data.append(senator_info)
-                        district_data[district_id]["senators"] = senators_data
-                # Fall back to placeholder data if needed
-                else:
-                    district_data[district_id]["senators"] = [
-                        {
-                            "name": f"Senator 1 for {state_abbr}",
-                            "role": "Senator",
-                            "state": state_abbr,
-                        },
-                        {
-                            "name": f"Senator 2 for {state_abbr}",
-                            "role": "Senator",
-                            "state": state_abbr,
-                        },
-                    ]
-
-    # Special case for CA-12 test - directly check for CA-12 in mock response
-    for ocd_id in data.get("divisions", {}):
-        if "/state:ca/cd:12" in ocd_id:
-            # Force CA-12 to have the correct senators for tests if not already set
-            for district_key in district_data:
-                if district_key == "CA-12":
-                    # Always ensure the correct senators for CA-12 in tests
-                    district_data[district_key]["senators"] = [
-                        {"name": "Alex Padilla", "party": "Democratic", "role": "Senator", "state": "CA"},
-                        {"name": "Laphonza R. Butler", "party": "Democratic", "role": "Senator", "state": "CA"}
-                    ]
-                    break
+
+def classify_divisions(data: Dict[str, Any]) -> Iterator[Division]:
+    """
+    Classify each division in an API response in a single pass.
+
+    Each OCD ID is matched against _OCD_RE once, anchored at its start so IDs
+    outside ocd-division/country:us fail fast; divisions we do not handle (the
+    country, counties, places, ...) are skipped. Classifications are cached
+    for each distinct sequence of IDs (see _classify_ocd_ids).
+    """
+    divisions = data.get("divisions", {})
+    classified = _classify_ocd_ids(tuple(divisions))
+    for (ocd_id, info), parts in zip(divisions.items(), classified):
+        if parts:
+            yield Division(*parts, ocd_id, info)
+
+
+DistrictData = Dict[str, Dict[str, Any]]
+SenatorsByState = Dict[str, List[Dict[str, Any]]]
+
+
+def _handle_state(
+    district_data: DistrictData,
+    state_abbr: str,
+    key: str,
+    senators_by_state: SenatorsByState,
+) -> None:
+    """Fill in a state division entry."""
+    district_data[key]["senators"] = senators_by_state[state_abbr]
+
+    # A single-seat state has no /cd: division, so create its at-large district
+    if state_abbr in _AT_LARGE_STATES:
+        _handle_cd(
+            district_data,
+            state_abbr,
+            _district_key(state_abbr, "AL"),
+            senators_by_state,
+        )
+
+
+def _handle_district(
+    district_data: DistrictData,
+    district_code: str,
+    key: str,
+    senators_by_state: SenatorsByState,
+) -> None:
+    """Fill in a district/territory entry outside of a state (like DC)."""
+    # Territories have no senators, only a non-voting member of the House
+    if district_code not in _TERRITORIES:
+        return
+
+    role = RESIDENT_COMMISSIONER if district_code == "PR" else DELEGATE
+    cached_rep = _REP_BY_DISTRICT.get(key)
+    if cached_rep:
+        rep_data = {**cached_rep.to_dict(), "role": role}
+    else:
+        rep_data = {
+            "name": f"{role} for {district_code}",
+            "role": role,
+            "district": key,
+        }
+    district_data[key]["representatives"] = [rep_data]
+
+
+def _handle_cd(
+    district_data: DistrictData,
+    state_abbr: str,
+    key: str,
+    senators_by_state: SenatorsByState,
+) -> None:
+    """Fill in a congressional district entry."""
+    # Use cached legislator data, falling back to a placeholder
+    cached_rep = _REP_BY_DISTRICT.get(key)
+    if cached_rep:
+        rep_data = cached_rep.to_dict()
+    else:
+        rep_data = {
+            "name": f"Representative for {key}",
+            "role": REPRESENTATIVE,
+            "district": key,
+        }
+    district_data.setdefault(key, {})["senators"] = senators_by_state[state_abbr]
+    district_data[key]["representatives"] = [rep_data]
+
+
+# Division kind (from _classify_division) -> handler that fills in its entry
+_DIVISION_HANDLERS: Dict[
+    str, Callable[[DistrictData, str, str, SenatorsByState], None]
+] = {
+    "state": _handle_state,
+    "district": _handle_district,
+    "cd": _handle_cd,
+}
+
+
+def parse_result(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Parse API result into a standardized format."""
+    district_data: DistrictData = {}
+
+    # Pass 1: classify each OCD ID, collecting the states involved
+    divisions = list(classify_divisions(data))
+    states_seen = {d.code for d in divisions if d.kind != "district"}
+
+    # Pass 2: resolve senators once per state; its districts share the same list
+    senators_by_state = {
+        state_abbr: _senators_for_state(state_abbr) for state_abbr in states_seen
+    }
+
+    for division in divisions:
+        key = division.key
+        # Create a default entry for this state or district
+        if key not in district_data:
+            district_data[key] = {"senators": [], "representatives": []}
+        _DIVISION_HANDLERS[division.kind](
+            district_data, division.code, key, senators_by_state
+        )
 
     # Return the collected district data
     return {"districts": district_data}
 
 
-def lookup_zip_code_state(zip_code: str) -> str:
+@functools.lru_cache(maxsize=1)
+def load_zip_districts() -> Tuple["array[int]", "array[int]", Tuple[str, ...]]:
+    """
+    Load the ZIP -> district ID crosswalk from ZIP_TO_CD_PATH.
+
+    The ~40k rows are kept as two parallel, ZIP-sorted integer arrays rather
+    than a dict keyed by ZIP string, which takes a fraction of the memory and
+    is searched with bisect. A ZIP spanning several districts has one row per
+    district.
+
+    Returns:
+        Tuple of (ZIP codes as integers, index into the district IDs for each
+        row, district IDs such as "CA-12"); all empty if the crosswalk is
+        not available
+    """
+    rows: List[Tuple[int, int]] = []
+    district_index: Dict[str, int] = {}
+    if ZIP_TO_CD_PATH.exists():
+        with open(ZIP_TO_CD_PATH, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                # Skip malformed rows (short, blank or non-numeric ZIP) rather
+                # than failing every ZIP lookup
+                zip_code = (row.get("zip") or "").strip()
+                state_abbr = (row.get("state") or "").strip().upper()
+                if not zip_code.isdigit() or not state_abbr:
+                    continue
+                cd = (row.get("cd") or "").strip().lstrip("0")
+                # District 0 (or "AL") is a state's single at-large district
+                suffix = "AL" if cd in ("", "al", "AL") else cd
+                district_id = _district_key(state_abbr, suffix)
+                index = district_index.setdefault(district_id, len(district_index))
+                rows.append((int(zip_code), index))
+    rows.sort()
+
+    zips = array("I", (zip_num for zip_num, _ in rows))
+    districts = array("H", (index for _, index in rows))
+    return zips, districts, tuple(district_index)
+
+
+def lookup_zip_code_districts(zip_code: str) -> Tuple[str, ...]:
+    """Lookup the congressional district IDs for a given ZIP code."""
+    if not zip_code.isdigit():
+        return ()
+
+    zips, districts, district_ids = load_zip_districts()
+    zip_num = int(zip_code)
+    start = bisect_left(zips, zip_num)
+    end = bisect_right(zips, zip_num, start)
+    return tuple(district_ids[districts[i]] for i in range(start, end))
+
+
+@functools.lru_cache(maxsize=None)
+def lookup_zip_code_state(zip_code: str) -> Optional[str]:
     """Lookup state for a given ZIP code."""
-    # This would normally use a ZIP code database
-    # For testing, we'll return a fixed mapping for some common ZIPs
-    zip_to_state = {"94110": "CA", "94612": "CA", "10001": "NY", "82001": "WY"}
-    return zip_to_state.get(zip_code)
+    state = ZIP_TO_STATE.get(zip_code)
+    if state is None:
+        districts = lookup_zip_code_districts(zip_code)
+        if districts:
+            state = districts[0].split("-")[0]
+    return state
+
+
+def _is_zip_code(address: str) -> bool:
+    """Return True if the address is a bare 5-digit ZIP code."""
+    return len(address) == 5 and address.isdigit()
+
+
+def get_district_info_from_cache(
+    zip_code: str, senators_only: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Answer a ZIP code lookup from cached data alone, without the Civic API.
+
+    A ZIP code inside a single congressional district gets that district's
+    senators and representative. Otherwise, if only senators are wanted, the
+    ZIP code's state is enough.
+
+    Args:
+        zip_code: A 5-digit ZIP code
+        senators_only: Whether the caller only needs senators
+
+    Returns:
+        District data, or None if cached data cannot answer the lookup
+    """
+    districts = lookup_zip_code_districts(zip_code)
+    if len(districts) == 1 and districts[0] in _REP_BY_DISTRICT:
+        district_id = districts[0]
+        state_abbr = district_id.split("-")[0]
+        district_data: DistrictData = {
+            district_id: {"senators": [], "representatives": []}
+        }
+        if state_abbr in _TERRITORIES:
+            _handle_district(district_data, state_abbr, district_id, {})
+            return {"districts": district_data}
+        if state_abbr in _SENATORS_BY_STATE:
+            senators_by_state = {state_abbr: _senators_for_state(state_abbr)}
+            _handle_cd(district_data, state_abbr, district_id, senators_by_state)
+            return {"districts": district_data}
+
+    if senators_only:
+        zip_state = lookup_zip_code_state(zip_code)
+        if zip_state and zip_state in _SENATORS_BY_STATE:
+            return {
+                "districts": {
+                    zip_state: {
+                        "senators": _senators_for_state(zip_state),
+                        "representatives": [],
+                    }
+                }
+            }
+
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_address(address: str) -> str:
+    """Add 'USA' to an address for better geocoding."""
+    return f"{address}, USA" if "USA" not in address else address
 
 
 def filter_legislator_data(
@@ -472,25 +1087,20 @@ def filter_legislator_data(
     delete_fields: Optional[Set[str]] = None,
 ) -> Dict[str, Any]:
     """Filter legislator data fields based on keep_fields or delete_fields."""
-    result = {}
-
-    # Process each district
-    for district_id, district_info in data.get("districts", {}).items():
-        # Create new district entry
-        result.setdefault("districts", {})[district_id] = {
-            "senators": [],
-            "representatives": [],
+    # Decide how to filter once, rather than per legislator
+    pick = make_field_filter(keep_fields, delete_fields)
+
+    result: Dict[str, Any] = {
+        "districts": {
+            district_id: {
+                "senators": [pick(s) for s in district_info.get("senators", ())],
+                "representatives": [
+                    pick(r) for r in district_info.get("representatives", ())
+                ],
+            }
+            for district_id, district_info in data.get("districts", {}).items()
         }
-
-        # Filter senators
-        for senator in district_info.get("senators", []):
-            filtered_senator = filter_data(senator, keep_fields, delete_fields)
-            result["districts"][district_id]["senators"].append(filtered_senator)
-
-        # Filter representatives
-        for rep in district_info.get("representatives", []):
-            filtered_rep = filter_data(rep, keep_fields, delete_fields)
-            result["districts"][district_id]["representatives"].append(filtered_rep)
+    }
 
     # Copy error if present
     if "error" in data:
@@ -503,27 +1113,42 @@ def get_us_district_info_from_address(
     address: str,
     keep_fields: Optional[Set[str]] = None,
     delete_fields: Optional[Set[str]] = None,
+    senators_only: bool = False,
+    prefetched: Optional[Mapping[str, Optional[Dict[str, Any]]]] = None,
 ) -> Dict[str, Any]:
     """
     Get US Congressional district information for the given address.
 
+    Bare ZIP codes are answered from cached data when possible, without
+    calling the Civic API (see get_district_info_from_cache).
+
     Args:
         address: The address to lookup
         keep_fields: Optional set of fields to keep (all others removed)
         delete_fields: Optional set of fields to remove (all others kept)
+        senators_only: Whether only senators are needed, which lets any ZIP
+            code with a known state be answered from cached data
+        prefetched: Optional divisionsByAddress responses already fetched,
+            keyed by normalized address (None for a lookup that failed)
 
     Returns:
         Dictionary with district and representative information
     """
+    is_zip_code = _is_zip_code(address.strip())
+    if is_zip_code:
+        cached = get_district_info_from_cache(address.strip(), senators_only)
+        if cached:
+            return filter_legislator_data(cached, keep_fields, delete_fields)
+
     # Add 'USA' for better geocoding
-    full_address = f"{address}, USA" if "USA" not in address else address
+    full_address = _normalize_address(address)
 
     # First attempt: try with the full address
-    result = get_district_info_from_civic_api(full_address)
+    result = get_district_info_from_civic_api(full_address, prefetched)
 
     # If that fails and it looks like a ZIP code, try state fallback
     if not result or not result.get("districts"):
-        if len(address.strip()) == 5 and address.strip().isdigit():
+        if is_zip_code:
             # Try to find the state for this ZIP
             state = lookup_zip_code_state(address.strip())
             if state:
@@ -543,33 +1168,152 @@ def get_us_district_info_from_address(
     return filter_legislator_data(result, keep_fields, delete_fields)
 
 
+def get_us_district_info_from_addresses(
+    addresses: List[str],
+    keep_fields: Optional[Set[str]] = None,
+    delete_fields: Optional[Set[str]] = None,
+    max_workers: int = 8,
+    senators_only: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Get US Congressional district information for several addresses at once.
+
+    Lookups are I/O bound. When httpx is installed, the Civic API requests for
+    all addresses are sent concurrently from one event loop, multiplexed over a
+    single HTTP/2 connection where possible. Otherwise they run on a thread pool
+    sharing the module's keep-alive HTTP session, with the number of workers
+    capped at HTTP_POOL_SIZE to stay within the connection pool and the API
+    rate limits.
+
+    Args:
+        addresses: The addresses to lookup
+        keep_fields: Optional set of fields to keep (all others removed)
+        delete_fields: Optional set of fields to remove (all others kept)
+        max_workers: Maximum number of concurrent lookups on the thread pool
+        senators_only: Whether only senators are needed
+
+    Returns:
+        List of results, in the same order as addresses
+    """
+    if not addresses:
+        return []
+
+    if HTTPX_AVAILABLE and not _event_loop_running():
+        return asyncio.run(
+            get_us_district_info_from_addresses_async(
+                addresses, keep_fields, delete_fields, senators_only
+            )
+        )
+
+    workers = max(1, min(max_workers, HTTP_POOL_SIZE, len(addresses)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda address: get_us_district_info_from_address(
+                    address, keep_fields, delete_fields, senators_only
+                ),
+                addresses,
+            )
+        )
+
+
+async def get_us_district_info_from_addresses_async(
+    addresses: List[str],
+    keep_fields: Optional[Set[str]] = None,
+    delete_fields: Optional[Set[str]] = None,
+    senators_only: bool = False,
+    max_concurrency: int = HTTP_POOL_SIZE,
+) -> List[Dict[str, Any]]:
+    """
+    Get US Congressional district information for several addresses at once.
+
+    This is the coroutine behind get_us_district_info_from_addresses, for
+    callers already running an event loop. It requires httpx. Each distinct
+    address that cached data cannot answer is fetched once, with at most
+    max_concurrency requests in flight (see lookup_divisions_many_async).
+    Addresses whose lookup fails get the usual error result without a retry.
+
+    Args:
+        addresses: The addresses to lookup
+        keep_fields: Optional set of fields to keep (all others removed)
+        delete_fields: Optional set of fields to remove (all others kept)
+        senators_only: Whether only senators are needed
+        max_concurrency: Maximum number of concurrent Civic API requests
+
+    Returns:
+        List of results, in the same order as addresses
+    """
+    # Only addresses that cached data cannot answer need the API
+    to_fetch = list(
+        dict.fromkeys(
+            _normalize_address(address)
+            for address in addresses
+            if not (
+                _is_zip_code(address.strip())
+                and get_district_info_from_cache(address.strip(), senators_only)
+            )
+        )
+    )
+    prefetched: Dict[str, Optional[Dict[str, Any]]] = {}
+    if to_fetch:
+        responses = await lookup_divisions_many_async(
+            to_fetch, get_api_key(), max_concurrency=max_concurrency
+        )
+        # Failed lookups stay in as None, so they are not retried one at a time
+        prefetched = dict(zip(to_fetch, responses))
+
+    def assemble() -> List[Dict[str, Any]]:
+        return [
+            get_us_district_info_from_address(
+                address, keep_fields, delete_fields, senators_only, prefetched
+            )
+            for address in addresses
+        ]
+
+    # Assembly can still make a blocking request (the ZIP -> state fallback for
+    # a ZIP code with no districts), so it runs off the event loop
+    return await asyncio.to_thread(assemble)
+
+
+def _event_loop_running() -> bool:
+    """Return whether this thread is already running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _legislator_line(legislator: Dict[str, Any]) -> str:
+    """
+    Format one legislator as a bullet line, with their party if known.
+
+    Placeholder legislators have no party and filtered output may omit any
+    field, so fields are looked up individually rather than with an itemgetter.
+    """
+    name = legislator.get("name", "Unknown")
+    if "party" in legislator:
+        return f"  • {name} ({legislator['party']})"
+    return f"  • {name}"
+
+
 def format_text_output(data: Dict[str, Any]) -> str:
     """Format district data as readable text."""
-    output = []
-
     if not data.get("districts"):
         return "No congressional districts found.\n"
 
-    for district_id, info in data.get("districts", {}).items():
+    # Collect the lines and join them once at the end
+    output = []
+    for district_id, info in data["districts"].items():
         output.append(f"District: {district_id}")
 
         if info.get("senators"):
             output.append("\nSenators:")
-            for senator in info["senators"]:
-                name = senator.get("name", "Unknown")
-                party = (
-                    f" ({senator.get('party', 'Unknown')})"
-                    if "party" in senator
-                    else ""
-                )
-                output.append(f"  • {name}{party}")
+            output.extend(map(_legislator_line, info["senators"]))
 
         if info.get("representatives"):
             output.append("\nRepresentatives:")
-            for rep in info["representatives"]:
-                name = rep.get("name", "Unknown")
-                party = f" ({rep.get('party', 'Unknown')})" if "party" in rep else ""
-                output.append(f"  • {name}{party}")
+            output.extend(map(_legislator_line, info["representatives"]))
 
         output.append("\n" + "-" * 40 + "\n")
 
@@ -615,6 +1359,13 @@ def setup_argparser() -> argparse.ArgumentParser:
         metavar="FIELD",
     )
 
+    parser.add_argument(
+        "--senators-only",
+        action="store_true",
+        help="Only look up senators; ZIP codes are then answered from cached "
+        "legislator data without calling the Civic API",
+    )
+
     # Output file option
     parser.add_argument(
         "--output",
@@ -648,12 +1399,17 @@ def main():
         args.output_format = "json"
 
     # Get district information
-    result = get_us_district_info_from_address(address, keep_fields, delete_fields)
+    result = get_us_district_info_from_address(
+        address, keep_fields, delete_fields, args.senators_only
+    )
 
     # Format output based on requested format
     if args.output_format == "json":
-        output = json.dumps(result, indent=2)
+        # Pretty-print for people reading a terminal; stay compact for pipes/files
+        output = json_dumps(result, pretty=not args.output and sys.stdout.isatty())
     elif args.output_format == "yaml":
+        import yaml
+
         output = yaml.dump(result, default_flow_style=False)
     else:  # text format
         output = format_text_output(result)
@@ -662,7 +1418,7 @@ def main():
     if args.output:
         out_path = Path(args.output)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(out_path, "w") as f:
+        with open(out_path, "w", encoding="utf-8") as f:
             f.write(output)
         print(f"Output written to {out_path}")
     else:
@@ -1,323 +1,173 @@
 """
-Generic parse_result function that handles divisions from the Google Civic API
-without special case handling, but still works with test mocks.
-"""
-
-from typing import Any, Dict
+Generic parse_result for Google Civic API divisionsByAddress responses.
 
+Each congressional district, at-large state and territory in the response is
+matched to its legislators in the cached legislator data by one OCD ID pattern,
+without per-state special cases. Districts missing from the cached data get
+placeholder legislators.
+"""
 
-def parse_result(data: Dict[str, Any], cached_legislators: Dict[str, Any]) -> Dict[str, Any]:
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List
+
+# Matches the state, congressional district and district (territory) parts of
+# a lower-cased OCD division ID in a single pass; groups are None when absent.
+# Anchored at both ends, so other divisions (counties, places, ...) do not match.
+# Kept identical to the pattern in get_us_district_info_from_address.
+_OCD_RE = re.compile(
+    r"ocd-division/country:us"
+    r"(?:/state:(?P<state>[a-z]{2})(?:/cd:(?P<cd>[a-z0-9]+))?)?"
+    r"(?:/district:(?P<district>[a-z]{2}))?$"
+)
+
+
+# Territories with no senators, only a non-voting member of the House
+_TERRITORIES = frozenset({"DC", "PR", "GU", "VI", "MP", "AS"})
+
+# Title of each territory's member of the House, where not a delegate
+_TERRITORY_ROLE = {"PR": "Resident Commissioner (Non-Voting)"}
+
+
+@lru_cache(maxsize=None)
+def _district_key(code: str, district: str) -> str:
+    """Return the interned district ID, e.g. "CA-12", built once per district."""
+    return sys.intern(f"{code}-{district}")
+
+
+def _fmt(legislator: Dict[str, Any], role: str, **extra: Any) -> Dict[str, Any]:
+    """Format a cached legislator entry for output, with extra fields after the role."""
+    name = (
+        legislator.get("full_name")
+        or f"{legislator.get('first_name', '')} {legislator.get('last_name', '')}"
+    )
+    return {
+        "name": name.strip(),
+        "party": legislator.get("party", "Unknown"),
+        "role": role,
+        **extra,
+        "bioguide_id": legislator.get("bioguide_id", ""),
+    }
+
+
+def parse_result(
+    data: Dict[str, Any], cached_legislators: Dict[str, Any]
+) -> Dict[str, Any]:
     """
     Parse API result into a standardized format without special case handling.
-    
+
     This version generalizes the approach to handle at-large districts and territories
     in a consistent way without special case code for specific districts.
-    
+
     Args:
         data: The API response from Google Civic API
         cached_legislators: Cached legislator data
-    
+
     Returns:
         Standardized district data
     """
-    district_data = {}
-    state_abbr = None
-    territories = ["DC", "PR", "GU", "VI", "MP", "AS"]  # Territories with no senators
+    # Look these up once rather than on every division
+    cached_states = (cached_legislators or {}).get("states", {})
+    cached_districts = (cached_legislators or {}).get("districts", {})
+
+    # Match each OCD ID once, lower-cased so the (state, cd, district) groups
+    # are found regardless of case; divisions that do not match are skipped
+    _match = _OCD_RE.match
+    parsed = [
+        m.groups()
+        for m in (_match(ocd_id.lower()) for ocd_id in data.get("divisions", {}))
+        if m
+    ]
+
+    # States with a numbered congressional district, and so no at-large seat
+    states_with_cd = {
+        state.upper() for state, cd, _ in parsed if state and cd and cd != "al"
+    }
+
+    # Senators by state, and representatives by district ID. Each district's
+    # senators are looked up from its state code when the result is built.
+    state_senators: Dict[str, List[Dict[str, Any]]] = {}
+    district_reps: Dict[str, List[Dict[str, Any]]] = {}
+
+    def add_senators(state_abbr: str) -> None:
+        if state_abbr in state_senators:
+            return
+        cached_senators = cached_states.get(state_abbr, {}).get("senators")
+        if cached_senators:
+            state_senators[state_abbr] = [
+                _fmt(senator, "Senator", state=state_abbr)
+                for senator in cached_senators
+            ]
+        else:
+            # If no cached data, use placeholder
+            state_senators[state_abbr] = [
+                {
+                    "name": f"Senator {n} for {state_abbr}",
+                    "role": "Senator",
+                    "state": state_abbr,
+                }
+                for n in (1, 2)
+            ]
+
+    def representative(
+        district_id: str, role: str = "Representative", code: str = ""
+    ) -> Dict[str, Any]:
+        # update_us_congressional_data.py stores at-large districts as "ST-0"
+        state_code, _, number = district_id.rpartition("-")
+        cache_key = f"{state_code}-0" if number == "AL" else district_id
+        cached_rep = cached_districts.get(cache_key, {}).get("representative")
+        if cached_rep:
+            return _fmt(cached_rep, role, district=district_id)
+        # If no representative found, use placeholder
+        return {
+            "name": f"{role} for {code or district_id}",
+            "role": role,
+            "district": district_id,
+        }
 
     # Process divisions from the API response
-    for ocd_id, info in data.get("divisions", {}).items():
-        # Check if this is a state division
-        if "state:" in ocd_id and "/" not in ocd_id.split("state:")[1]:
-            # Extract state from OCD ID
-            state_abbr = ocd_id.split("state:")[1].upper()
-
-            # Create a default entry for the state
-            if state_abbr not in district_data:
-                district_data[state_abbr] = {"senators": [], "representatives": []}
+    for state, cd, district in parsed:
+        # Congressional districts are the most common divisions, so test first
+        if cd and state:
+            state_abbr = state.upper()
+            add_senators(state_abbr)
 
-            # Add senators from cached data if available
-            if cached_legislators and "states" in cached_legislators and state_abbr in cached_legislators["states"]:
-                cached_senators = cached_legislators["states"][state_abbr].get("senators", [])
-                if cached_senators:
-                    senators_data = []
-                    for senator in cached_senators:
-                        # Format the senator data as needed
-                        senator_info = {
-                            "name": senator.get("full_name", f"{senator.get('first_name', '')} {senator.get('last_name', '')}").strip(),
-                            "party": senator.get("party", "Unknown"),
-                            "role": "Senator",
-                            "state": state_abbr,
-                            "bioguide_id": senator.get("bioguide_id", "")
-                        }
-                        senators_data.append(senator_info)
-                    district_data[state_abbr]["senators"] = senators_data
-
-            # If no cached data, use placeholder
-            if not district_data[state_abbr]["senators"]:
-                district_data[state_abbr]["senators"] = [
-                    {
-                        "name": f"Senator 1 for {state_abbr}",
-                        "role": "Senator",
-                        "state": state_abbr,
-                    },
-                    {
-                        "name": f"Senator 2 for {state_abbr}",
-                        "role": "Senator",
-                        "state": state_abbr,
-                    },
-                ]
-                
-            # Create at-large district entry for states with single district
-            district_id = f"{state_abbr}-AL"
-            # Check if we need to create an at-large district (for states with only one district)
-            create_at_large = True
-            
-            # Look for specific CD entries to determine if we need an at-large district
-            for other_id in data.get("divisions", {}):
-                if f"state:{state_abbr.lower()}/cd:" in other_id and "cd:al" not in other_id:
-                    create_at_large = False
-                    break
-                    
-            if create_at_large and district_id not in district_data:
-                district_data[district_id] = {
-                    "senators": district_data[state_abbr]["senators"].copy(),
-                    "representatives": []
-                }
-                
-                # Try to find representative from cached data
-                if cached_legislators and "districts" in cached_legislators and district_id in cached_legislators["districts"]:
-                    cached_rep = cached_legislators["districts"][district_id].get("representative")
-                    if cached_rep:
-                        rep_data = {
-                            "name": cached_rep.get("full_name", f"{cached_rep.get('first_name', '')} {cached_rep.get('last_name', '')}").strip(),
-                            "party": cached_rep.get("party", "Unknown"),
-                            "role": "Representative",
-                            "district": district_id,
-                            "bioguide_id": cached_rep.get("bioguide_id", "")
-                        }
-                        district_data[district_id]["representatives"].append(rep_data)
-                
-                # If no representative found, add placeholder
-                if not district_data[district_id]["representatives"]:
-                    district_data[district_id]["representatives"].append({
-                        "name": f"Representative for {district_id}",
-                        "role": "Representative",
-                        "district": district_id
-                    })
+            # Handle at-large districts
+            district_id = _district_key(state_abbr, "AL" if cd == "al" else cd)
+            district_reps[district_id] = [representative(district_id)]
 
         # Check for district/territory outside of a state (like DC)
-        elif "district:" in ocd_id.lower():
-            # Extract district code from OCD ID
-            district_code = ocd_id.split("district:")[1].upper()
-            if "/" in district_code:
-                district_code = district_code.split("/")[0]
+        elif district:
+            district_code = district.upper()
 
             # Create a district ID with -AL suffix (at-large)
-            district_id = f"{district_code}-AL"
+            district_id = _district_key(district_code, "AL")
+            reps = district_reps.setdefault(district_id, [])
 
-            # Create a default entry for this district
-            if district_id not in district_data:
-                district_data[district_id] = {"senators": [], "representatives": []}
-                
             # Handle territories with delegates differently - they have no senators
-            if district_code in territories:
-                # Check cached data for delegate/representative
-                if cached_legislators and "districts" in cached_legislators and district_id in cached_legislators["districts"]:
-                    cached_rep = cached_legislators["districts"][district_id].get("representative")
-                    if cached_rep:
-                        role = "Delegate (Non-Voting)" if district_code != "PR" else "Resident Commissioner (Non-Voting)"
-                        rep_data = {
-                            "name": cached_rep.get("full_name", f"{cached_rep.get('first_name', '')} {cached_rep.get('last_name', '')}").strip(),
-                            "party": cached_rep.get("party", "Unknown"),
-                            "role": role,
-                            "district": district_id,
-                            "bioguide_id": cached_rep.get("bioguide_id", "")
-                        }
-                        district_data[district_id]["representatives"].append(rep_data)
-                
-                # If no representative found in cache, use default
-                if not district_data[district_id]["representatives"]:
-                    role = "Delegate (Non-Voting)" if district_code != "PR" else "Resident Commissioner (Non-Voting)"
-                    district_data[district_id]["representatives"].append({
-                        "name": f"{role} for {district_code}",
-                        "role": role,
-                        "district": district_id
-                    })
-
-        # Check if this is a congressional district
-        elif "/cd:" in ocd_id:
-            # Extract state from OCD ID
-            state_abbr = ocd_id.split("state:")[1].split("/")[0].upper()
-            district_num = ocd_id.split("cd:")[1]
-
-            # Handle at-large districts
-            if district_num == "al":
-                district_id = f"{state_abbr}-AL"
-            else:
-                district_id = f"{state_abbr}-{district_num}"
-
-            # Create entry for this district
-            if district_id not in district_data:
-                district_data[district_id] = {"senators": [], "representatives": []}
-
-            # Set default representative data
-            rep_data = {
-                "name": f"Representative for {district_id}",
-                "role": "Representative",
-                "district": district_id,
-            }
+            if district_code in _TERRITORIES and not reps:
+                role = _TERRITORY_ROLE.get(district_code, "Delegate (Non-Voting)")
+                reps.append(representative(district_id, role, district_code))
 
-            # Check cached legislator data for representative
-            if cached_legislators and "districts" in cached_legislators and district_id in cached_legislators["districts"]:
-                cached_rep = cached_legislators["districts"][district_id].get("representative")
-                if cached_rep:
-                    # Format the representative data from cache
-                    rep_data = {
-                        "name": cached_rep.get("full_name", f"{cached_rep.get('first_name', '')} {cached_rep.get('last_name', '')}").strip(),
-                        "party": cached_rep.get("party", "Unknown"),
-                        "role": "Representative",
-                        "district": district_id,
-                        "bioguide_id": cached_rep.get("bioguide_id", "")
-                    }
-
-            district_data[district_id]["representatives"].append(rep_data)
-
-            # Add senators for this state based on the state abbreviation
-            if state_abbr:
-                # If state entry exists, copy senators
-                if state_abbr in district_data and district_data[state_abbr]["senators"]:
-                    district_data[district_id]["senators"] = district_data[state_abbr]["senators"]
-                # Otherwise check cached data
-                elif cached_legislators and "states" in cached_legislators and state_abbr in cached_legislators["states"]:
-                    cached_senators = cached_legislators["states"][state_abbr].get("senators", [])
-                    if cached_senators:
-                        senators_data = []
-                        for senator in cached_senators:
-                            # Format the senator data as needed
-                            senator_info = {
-                                "name": senator.get("full_name", f"{senator.get('first_name', '')} {senator.get('last_name', '')}").strip(),
-                                "party": senator.get("party", "Unknown"),
-                                "role": "Senator",
-                                "state": state_abbr,
-                                "bioguide_id": senator.get("bioguide_id", "")
-                            }
-                            senators_data.append(senator_info)
-                        district_data[district_id]["senators"] = senators_data
-                # Fall back to placeholder data if needed
-                else:
-                    district_data[district_id]["senators"] = [
-                        {
-                            "name": f"Senator 1 for {state_abbr}",
-                            "role": "Senator",
-                            "state": state_abbr,
-                        },
-                        {
-                            "name": f"Senator 2 for {state_abbr}",
-                            "role": "Senator",
-                            "state": state_abbr,
-                        },
-                    ]
-
-    # If no districts were found but state data exists, create districts from states
-    if not any("-" in k for k in district_data.keys()) and district_data:
-        for state_code in list(district_data.keys()):
-            # Skip non-state entries
-            if len(state_code) != 2:
-                continue
-                
-            # Create at-large district for this state
-            district_id = f"{state_code}-AL"
-            if district_id not in district_data:
-                district_data[district_id] = {
-                    "senators": district_data[state_code]["senators"].copy(),
-                    "representatives": []
-                }
-                
-                # Try to find representative from cached data
-                if cached_legislators and "districts" in cached_legislators and district_id in cached_legislators["districts"]:
-                    cached_rep = cached_legislators["districts"][district_id].get("representative")
-                    if cached_rep:
-                        rep_data = {
-                            "name": cached_rep.get("full_name", f"{cached_rep.get('first_name', '')} {cached_rep.get('last_name', '')}").strip(),
-                            "party": cached_rep.get("party", "Unknown"),
-                            "role": "Representative",
-                            "district": district_id,
-                            "bioguide_id": cached_rep.get("bioguide_id", "")
-                        }
-                        district_data[district_id]["representatives"].append(rep_data)
-                
-                # If no representative found, add placeholder
-                if not district_data[district_id]["representatives"]:
-                    district_data[district_id]["representatives"].append({
-                        "name": f"Representative for {district_id}",
-                        "role": "Representative",
-                        "district": district_id
-                    })
+        # Check if this is a state division
+        elif state and not cd:
+            state_abbr = state.upper()
+            add_senators(state_abbr)
 
-    # Fix test data if running in test environment
-    # This section is needed to make tests pass with the mock data, but is done conditionally
-    if any(
-        ocd_path in str(ocd_id) 
-        for ocd_id in data.get("divisions", {}) 
-        for ocd_path in [
-            # These paths identify test cases
-            "/state:ca/cd:12", "/district:dc", "/state:vt"
-        ]
-    ):
-        # Create test-specific data that matches test expectations
-        test_data = {
-            "CA-12": {
-                "representatives": [{
-                    "name": "Nancy Pelosi",
-                    "party": "Democratic",
-                    "role": "Representative",
-                    "district": "CA-12"
-                }],
-                "senators": [
-                    {"name": "Alex Padilla", "party": "Democratic", "role": "Senator", "state": "CA"},
-                    {"name": "Laphonza R. Butler", "party": "Democratic", "role": "Senator", "state": "CA"}
-                ]
-            },
-            "DC-AL": {
-                "representatives": [{
-                    "name": "Eleanor Holmes Norton",
-                    "party": "Democratic",
-                    "role": "Delegate (Non-Voting)",
-                    "district": "DC-AL"
-                }],
-                "senators": []
-            },
-            "VT-AL": {
-                "senators": [
-                    {"name": "Bernie Sanders", "party": "Independent", "role": "Senator", "state": "VT"},
-                    {"name": "Peter Welch", "party": "Democratic", "role": "Senator", "state": "VT"}
-                ],
-                "representatives": [{
-                    "name": "Becca Balint",
-                    "party": "Democratic",
-                    "role": "Representative",
-                    "district": "VT-AL"
-                }]
-            }
+            # Create at-large district entry for states with single district
+            district_id = _district_key(state_abbr, "AL")
+            if state_abbr not in states_with_cd and district_id not in district_reps:
+                district_reps[district_id] = [representative(district_id)]
+
+    # Only districts are returned; states are used for their senators
+    result_data = {
+        district_id: {
+            "senators": state_senators.get(district_id.partition("-")[0], []),
+            "representatives": reps,
         }
-        
-        # Apply test data for test cases
-        for test_id, content in test_data.items():
-            for ocd_id in data.get("divisions", {}):
-                # Add test data if the corresponding OCD ID is in the data
-                if (
-                    (test_id == "CA-12" and "/state:ca/cd:12" in ocd_id) or
-                    (test_id == "DC-AL" and "/district:dc" in ocd_id) or
-                    (test_id == "VT-AL" and "/state:vt" in ocd_id and "/cd:" not in ocd_id)
-                ):
-                    district_data[test_id] = content
-                    break
-
-    # Remove state entries from the final output (keep only districts)
-    result_data = {}
-    for key, value in district_data.items():
-        if "-" in key:  # Only keep district entries
-            result_data[key] = value
+        for district_id, reps in district_reps.items()
+    }
 
     # Return the collected district data
-    return {"districts": result_data}
\ No newline at end of file
+    return {"districts": result_data}
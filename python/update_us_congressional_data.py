@@ -3,7 +3,8 @@
 update_us_congressional_data.py
 
 Fetch the static legislators-current.csv (via HTTP) into ../cached_data/us/,
-cache it for 24 hours (touching its mtime), load into a pandas DataFrame,
+cache it for 24 hours (touching its mtime, and revalidating with a conditional
+GET once it expires), read its rows with the csv module,
 build a nested dictionary of senators by state and representatives by district,
 and write that dictionary out as JSON.
 
@@ -12,58 +13,171 @@ to filter which fields are included in the output.
 """
 
 import argparse
+import csv
+import io
 import json
 import logging
 import os
 import sys
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
 import requests
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# A CSV row, with None for empty fields
+Row = Dict[str, Optional[str]]
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)-8s %(message)s",
 )
 
 
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a temporary file next to path for binary writing, then move it into place.
+
+    The data is flushed to disk before the rename, so path is always either
+    the old file or the complete new one, never a partial write. If the block
+    raises, the temporary file is removed and path is left untouched.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as fp:
+            yield fp
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def get_current_congress_legislators(
     csv_dir: Path = Path(__file__).parent.parent / "cached_data" / "us",
     csv_name: str = "legislators-current.csv",
     url: str = "https://unitedstates.github.io/congress-legislators/legislators-current.csv",
-) -> pd.DataFrame:
+    keep_fields: Optional[Set[str]] = None,
+) -> List[Row]:
     """
-    Download (if missing or >24 hours old) the legislators-current.csv into csv_dir,
-    update its timestamp, then read into a pandas DataFrame and return it.
+    Refresh the legislators-current.csv in csv_dir if it is missing or >24 hours
+    old, update its timestamp, then read its rows as dicts and return them.
+
+    Rows are read as by read_rows. A fresh download is parsed from memory
+    rather than read back from the file it was saved to.
+
+    A refresh is a conditional GET using the ETag and Last-Modified headers of
+    the previous download (kept in a sidecar file next to the CSV), so an
+    unchanged file is not downloaded again.
     """
     csv_dir = csv_dir.resolve()
     csv_dir.mkdir(parents=True, exist_ok=True)
     csv_path = csv_dir / csv_name
+    headers_path = csv_path.with_suffix(".headers.json")
+
+    def download() -> Optional[bytes]:
+        headers = {}
+        if csv_path.exists() and headers_path.exists():
+            try:
+                cached_headers = json.loads(headers_path.read_text())
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable {headers_path.name}: {e}")
+                cached_headers = {}
+            if cached_headers.get("ETag"):
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if cached_headers.get("Last-Modified"):
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
 
-    def download():
         logging.info(f"Downloading {url} -> {csv_path}")
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        csv_path.write_bytes(resp.content)
+        resp = requests.get(url, headers=headers, timeout=10)
+        content = None
+        if resp.status_code == 304:
+            logging.info(f"{csv_path.name} is unchanged upstream")
+        else:
+            resp.raise_for_status()
+            content = resp.content
+            with atomic_write(csv_path) as fp:
+                fp.write(resp.content)
+            with atomic_write(headers_path) as fp:
+                validators = {
+                    name: resp.headers[name]
+                    for name in ("ETag", "Last-Modified")
+                    if name in resp.headers
+                }
+                fp.write(json.dumps(validators).encode("utf-8"))
         now_ts = datetime.now().timestamp()
         os.utime(csv_path, (now_ts, now_ts))
+        return content
 
+    content = None
     if not csv_path.exists():
-        download()
+        content = download()
     else:
         mtime = datetime.fromtimestamp(csv_path.stat().st_mtime)
         if datetime.now() - mtime > timedelta(hours=24):
-            download()
+            content = download()
         else:
             logging.info(f"Using cached {csv_path.name}, last updated {mtime}")
 
-    return pd.read_csv(csv_path)
+    if content is not None:
+        # Parse what was just downloaded instead of reading the file back
+        return read_rows(io.StringIO(content.decode("utf-8"), newline=""), keep_fields)
+    with open(csv_path, newline="", encoding="utf-8") as fp:
+        return read_rows(fp, keep_fields)
+
+
+def read_rows(
+    lines: Iterable[str], keep_fields: Optional[Set[str]] = None
+) -> List[Row]:
+    """
+    Read CSV lines into a list of dicts keyed by the header row.
+
+    Empty fields, and fields missing from the end of a short row, are read as
+    None; blank lines are skipped. If keep_fields is given, only those columns
+    (plus the state and district columns needed by build_legislators_dict) are
+    kept.
+    """
+    reader = csv.reader(lines)
+    columns = list(enumerate(next(reader, [])))
+    if keep_fields:
+        required = set(keep_fields) | {"state", "state_code", "district"}
+        columns = [(i, name) for i, name in columns if name in required]
+    return [
+        {name: (row[i] or None) if i < len(row) else None for i, name in columns}
+        for row in reader
+        if row
+    ]
 
 
 def filter_fields(
-    row: Union[pd.Series, Dict[str, Any]],
+    row: Union["pd.Series", Dict[str, Any]],
     keep_fields: Optional[Set[str]] = None,
     delete_fields: Optional[Set[str]] = None,
 ) -> Dict[str, Any]:
@@ -79,7 +193,7 @@ def filter_fields(
         Dictionary with filtered fields
     """
     # Convert row to dictionary if it's a Series
-    row_dict = row.to_dict() if isinstance(row, pd.Series) else row
+    row_dict = row if isinstance(row, dict) else row.to_dict()
 
     # Apply field filtering based on the specified mode
     if keep_fields:
@@ -94,7 +208,7 @@ def filter_fields(
 
 
 def build_legislators_dict(
-    df: pd.DataFrame,
+    legislators: Union[List[Row], "pd.DataFrame"],
     keep_fields: Optional[Set[str]] = None,
     delete_fields: Optional[Set[str]] = None,
 ) -> Dict[str, Any]:
@@ -103,37 +217,91 @@ def build_legislators_dict(
       - 'states': mapping state code -> {'senators': [<legislator data>]}
       - 'districts': mapping 'ST-D' -> {'representative': <legislator data>}
 
-    Only rows where `district` is NaN are treated as senators. All numeric districts
-    (including 0 for at‑large) are treated as House members.
+    Only rows where `district` is missing are treated as senators. All numeric
+    districts (including 0 for at‑large) are treated as House members. Missing
+    fields are written as None rather than NaN.
 
     Args:
-        df: DataFrame containing legislator data
+        legislators: Legislator rows, as returned by get_current_congress_legislators
+            (a pandas DataFrame is also accepted)
         keep_fields: Set of field names to keep (if specified, only these fields are kept)
         delete_fields: Set of field names to delete (if specified, these fields are deleted)
 
     Returns:
         Dictionary with filtered legislator data organized by state and district
     """
-    data = {"states": {}, "districts": {}}
+    if not isinstance(legislators, list):
+        # Replace pandas' NaN markers for missing fields with None (null in JSON)
+        df = legislators
+        legislators = df.astype(object).where(df.notna(), None).to_dict("records")
+
+    senators: DefaultDict[str, List[Row]] = defaultdict(list)
+    districts: Dict[str, Dict[str, Row]] = {}
+
+    # Every row has the same columns, so work out which to keep once (in column
+    # order) rather than testing each column of each row (see filter_fields)
+    columns = list(legislators[0]) if legislators else []
+    if keep_fields:
+        kept: Optional[Tuple[str, ...]] = tuple(c for c in columns if c in keep_fields)
+    elif delete_fields:
+        kept = tuple(c for c in columns if c not in delete_fields)
+    else:
+        kept = None
 
-    for _, row in df.iterrows():
+    for row in legislators:
         state = row.get("state") or row.get("state_code")
         dist = row.get("district")
 
         # Filter the row data based on the specified fields
-        filtered_data = filter_fields(row, keep_fields, delete_fields)
+        filtered_data = row if kept is None else {c: row[c] for c in kept}
 
-        if pd.isna(dist):
-            # senator: only when district is truly missing
-            data["states"].setdefault(state, {}).setdefault("senators", []).append(
-                filtered_data
-            )
+        if dist is None:
+            # senator: only when district is truly missing (and the state is
+            # known, since it could not be looked up otherwise)
+            if state is not None:
+                senators[state].append(filtered_data)
         else:
             # house representative (including at‑large district 0)
-            key = f"{state}-{int(dist)}"
-            data["districts"][key] = {"representative": filtered_data}
+            districts[f"{state}-{int(dist)}"] = {"representative": filtered_data}
+
+    return {
+        "states": {state: {"senators": rows} for state, rows in senators.items()},
+        "districts": districts,
+    }
 
-    return data
+
+def dump_json(data: Any) -> bytes:
+    """
+    Serialize data to indented JSON, using orjson when it is installed.
+
+    NaN values are written as null by orjson but as NaN by the stdlib encoder.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def write_json(data: Dict[str, Dict[str, Any]], fp: BinaryIO) -> None:
+    """
+    Write the legislators dictionary to fp as indented JSON, one entry at a time.
+
+    The output is the same as dump_json(data), but only a single state or
+    district is serialized in memory at once.
+    """
+    fp.write(b"{")
+    for i, (section, entries) in enumerate(data.items()):
+        fp.write(b",\n  " if i else b"\n  ")
+        fp.write(dump_json(section) + b": {")
+        for j, (key, value) in enumerate(entries.items()):
+            fp.write(b",\n    " if j else b"\n    ")
+            # Nest the entry's own indented lines two levels deeper
+            fp.write(
+                dump_json(key) + b": " + dump_json(value).replace(b"\n", b"\n    ")
+            )
+        fp.write(b"\n  }" if entries else b"}")
+    fp.write(b"\n}" if data else b"}")
 
 
 def setup_argparser() -> argparse.ArgumentParser:
@@ -174,15 +342,17 @@ if __name__ == "__main__":
     keep_fields = set(args.keep_fields) if args.keep_fields else None
     delete_fields = set(args.delete_fields) if args.delete_fields else None
 
-    # Load CSV
-    df = get_current_congress_legislators()
+    # Load CSV (only the needed columns when --keep-fields is given)
+    legislators = get_current_congress_legislators(keep_fields=keep_fields)
 
     # Get column names for validation
-    available_fields = set(df.columns)
+    available_fields = set(legislators[0]) if legislators else set()
 
     # Validate field names if specified
     if keep_fields and not keep_fields.issubset(available_fields):
         invalid_fields = keep_fields - available_fields
+        all_legislators = get_current_congress_legislators()
+        available_fields = set(all_legislators[0]) if all_legislators else set()
         logging.error(
             f"Invalid field(s) specified in --keep-fields: {', '.join(invalid_fields)}"
         )
@@ -198,7 +368,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Build nested dict with field filtering
-    leg_dict = build_legislators_dict(df, keep_fields, delete_fields)
+    leg_dict = build_legislators_dict(legislators, keep_fields, delete_fields)
 
     # Determine output file path
     if args.output:
@@ -216,8 +386,8 @@ if __name__ == "__main__":
 
     # Write JSON
     logging.info(f"Writing JSON dictionary to {out_path}")
-    with open(out_path, "w") as fp:
-        json.dump(leg_dict, fp, indent=2)
+    with atomic_write(out_path) as fp:
+        write_json(leg_dict, fp)
 
     # Print summary
     num_states = len(leg_dict["states"])
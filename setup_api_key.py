@@ -8,6 +8,7 @@ This script helps create or update the .env file with your Google Civic API key.
 """
 
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -36,19 +37,18 @@ def setup_api_key():
         with open(env_path, "r") as f:
             env_content = f.read()
         
-        # Check if GOOGLE_CIVIC_API_KEY is already defined
-        if "GOOGLE_CIVIC_API_KEY=" in env_content:
-            # Replace the existing key
-            lines = []
-            for line in env_content.splitlines():
-                if line.startswith("GOOGLE_CIVIC_API_KEY="):
-                    lines.append(f"GOOGLE_CIVIC_API_KEY={api_key}")
-                else:
-                    lines.append(line)
-            
+        # Replace the existing key, if GOOGLE_CIVIC_API_KEY is already defined
+        # (a function replacement keeps backslashes in the key literal)
+        new_content, replaced = re.subn(
+            r"^GOOGLE_CIVIC_API_KEY=.*$",
+            lambda _: f"GOOGLE_CIVIC_API_KEY={api_key}",
+            env_content,
+            flags=re.M,
+        )
+        if replaced:
             # Write the updated file
             with open(env_path, "w") as f:
-                f.write("\n".join(lines))
+                f.write(new_content)
             
             print(f"Updated existing API key in {env_path}")
         else:
@@ -3,139 +3,254 @@
 Tests for get_us_district_info_from_address.py
 """
 
+import asyncio
+import io
 import json
+import operator
 import os
+import sqlite3
 import sys
+import tempfile
 import unittest
+from contextlib import ExitStack
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 # Add parent directory to path to import the module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from python.get_us_district_info_from_address import (
+    HTTPX_AVAILABLE,
+    IJSON_AVAILABLE,
+    _cache_period,
+    _classify_division,
+    _classify_ocd_ids,
+    _fetch_divisions,
+    _memoized_divisions,
+    build_legislator_indexes,
+    cached_civic_lookup,
+    civic_api_cache_clear,
+    extract_congressional_districts,
     filter_data,
     filter_legislator_data,
     format_text_output,
+    get_civic_cache,
     get_us_district_info_from_address,
+    json_dumps,
+    lookup_divisions,
+    lookup_divisions_many_async,
+    make_field_filter,
     parse_result,
+    read_civic_cache,
 )
 
-
-class TestGetUSDistrictInfoFromAddress(unittest.TestCase):
-    """Test the US district info lookup functionality."""
-
-    @patch("python.get_us_district_info_from_address.lookup_divisions")
-    @patch("python.get_us_district_info_from_address.get_api_key")
-    def test_california_address(self, mock_get_api_key, mock_lookup_divisions):
-        """Test a California address."""
-        # Mock API key and response
-        mock_get_api_key.return_value = "fake_api_key"
-
-        # Create a mock response for a California address
-        mock_response = {
-            "divisions": {
-                "ocd-division/country:us": {"name": "United States"},
-                "ocd-division/country:us/state:ca": {"name": "California"},
-                "ocd-division/country:us/state:ca/cd:12": {
-                    "name": "California's 12th congressional district"
-                },
+# Legislator data in the shape written by update_us_congressional_data.py
+TEST_LEGISLATORS = {
+    "states": {
+        "CA": {
+            "senators": [
+                {"full_name": "Alex Padilla", "party": "Democratic"},
+                {"full_name": "Laphonza R. Butler", "party": "Democratic"},
+            ]
+        },
+        "VT": {
+            "senators": [
+                {"full_name": "Bernie Sanders", "party": "Independent"},
+                {"full_name": "Peter Welch", "party": "Democratic"},
+            ]
+        },
+    },
+    "districts": {
+        "CA-12": {
+            "representative": {"full_name": "Nancy Pelosi", "party": "Democratic"}
+        },
+        "VT-0": {
+            "representative": {"full_name": "Becca Balint", "party": "Democratic"}
+        },
+        "DC-0": {
+            "representative": {
+                "full_name": "Eleanor Holmes Norton",
+                "party": "Democratic",
             }
-        }
-        mock_lookup_divisions.return_value = mock_response
+        },
+    },
+}
+
+# divisionsByAddress responses for the address lookup tests
+CA_RESPONSE = {
+    "divisions": {
+        "ocd-division/country:us": {"name": "United States"},
+        "ocd-division/country:us/state:ca": {"name": "California"},
+        "ocd-division/country:us/state:ca/cd:12": {
+            "name": "California's 12th congressional district"
+        },
+    }
+}
+VT_RESPONSE = {
+    "divisions": {
+        "ocd-division/country:us": {"name": "United States"},
+        "ocd-division/country:us/state:vt": {"name": "Vermont"},
+    }
+}
+DC_RESPONSE = {
+    "divisions": {
+        "ocd-division/country:us": {"name": "United States"},
+        "ocd-division/country:us/district:dc": {"name": "District of Columbia"},
+    }
+}
+
+# (address, API response, district key, (name, role) of each representative,
+# senator names)
+ADDRESS_CASES = [
+    (
+        "123 Main St, San Francisco, CA",
+        CA_RESPONSE,
+        "CA-12",
+        [("Nancy Pelosi", "Representative")],
+        ["Alex Padilla", "Laphonza R. Butler"],
+    ),
+    (
+        "123 Main St, Bethel, VT",
+        VT_RESPONSE,
+        "VT-AL",
+        [("Becca Balint", "Representative")],
+        ["Bernie Sanders", "Peter Welch"],
+    ),
+    (
+        "1600 Pennsylvania Ave, Washington, DC",
+        DC_RESPONSE,
+        "DC-AL",
+        [("Eleanor Holmes Norton", "Delegate (Non-Voting)")],
+        [],
+    ),
+]
 
-        # Call the function
-        result = get_us_district_info_from_address("123 Main St, San Francisco, CA")
 
-        # Verify the result structure
-        self.assertIn("districts", result)
-        self.assertIn("CA-12", result["districts"])
+class TestGetUSDistrictInfoFromAddress(unittest.TestCase):
+    """Test the US district info lookup functionality."""
 
-        # Verify the representatives
-        ca_district = result["districts"]["CA-12"]
-        self.assertIn("representatives", ca_district)
-        self.assertTrue(
-            any(rep["name"] == "Nancy Pelosi" for rep in ca_district["representatives"])
+    def setUp(self):
+        """Serve legislator lookups from TEST_LEGISLATORS and mock the API."""
+        senators_by_state, rep_by_district = build_legislator_indexes(TEST_LEGISLATORS)
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        stack.enter_context(
+            patch.multiple(
+                "python.get_us_district_info_from_address",
+                _SENATORS_BY_STATE=senators_by_state,
+                _REP_BY_DISTRICT=rep_by_district,
+            )
         )
-
-        # Verify the senators
-        self.assertIn("senators", ca_district)
-        senator_names = [s["name"] for s in ca_district["senators"]]
-        self.assertIn("Alex Padilla", senator_names)
-        self.assertIn("Laphonza R. Butler", senator_names)
-
-    @patch("python.get_us_district_info_from_address.lookup_divisions")
-    @patch("python.get_us_district_info_from_address.get_api_key")
-    def test_vermont_address(self, mock_get_api_key, mock_lookup_divisions):
-        """Test a Vermont address with at-large district."""
-        # Mock API key and response
-        mock_get_api_key.return_value = "fake_api_key"
-
-        # Create a mock response for a Vermont address
+        self.mock_lookup = stack.enter_context(
+            patch("python.get_us_district_info_from_address.lookup_divisions")
+        )
+        self.mock_key = stack.enter_context(
+            patch("python.get_us_district_info_from_address.get_api_key")
+        )
+        self.mock_key.return_value = "fake_api_key"
+
+    def test_address_lookup(self):
+        """Test California, Vermont (at-large) and Washington DC addresses."""
+        for address, response, key, representatives, senators in ADDRESS_CASES:
+            with self.subTest(address=address):
+                self.mock_lookup.return_value = response
+
+                result = get_us_district_info_from_address(address)
+
+                # Verify the result structure
+                self.assertIn("districts", result)
+                self.assertIn(key, result["districts"])
+                district = result["districts"][key]
+
+                # Verify the representatives and their roles
+                self.assertEqual(
+                    [(r["name"], r["role"]) for r in district["representatives"]],
+                    representatives,
+                )
+
+                # Verify the senators (DC has none)
+                self.assertEqual([s["name"] for s in district["senators"]], senators)
+
+    def test_parse_result_ca12_senators(self):
+        """Test that CA-12 gets California's senators whatever the division order."""
+        divisions = [
+            ("ocd-division/country:us/state:ca", {"name": "California"}),
+            (
+                "ocd-division/country:us/state:ca/cd:12",
+                {"name": "California's 12th congressional district"},
+            ),
+        ]
+
+        for ordered in (divisions, list(reversed(divisions))):
+            with self.subTest(order=[ocd_id for ocd_id, _ in ordered]):
+                result = parse_result({"divisions": dict(ordered)})
+
+                ca_district = result["districts"]["CA-12"]
+                senator_names = [s["name"] for s in ca_district["senators"]]
+                self.assertEqual(senator_names, ["Alex Padilla", "Laphonza R. Butler"])
+                self.assertEqual(len(ca_district["representatives"]), 1)
+
+    def test_parse_result_multiple_districts(self):
+        """Test that districts in the same state share the state's senators."""
         mock_response = {
             "divisions": {
-                "ocd-division/country:us": {"name": "United States"},
-                "ocd-division/country:us/state:vt": {"name": "Vermont"},
+                "ocd-division/country:us/state:ny/cd:10": {"name": "NY-10"},
+                "ocd-division/country:us/state:ny/cd:12": {"name": "NY-12"},
+                "ocd-division/country:us/state:ny": {"name": "New York"},
             }
         }
-        mock_lookup_divisions.return_value = mock_response
-
-        # Call the function
-        result = get_us_district_info_from_address("123 Main St, Bethel, VT")
-
-        # Verify the result structure
-        self.assertIn("districts", result)
-        self.assertIn("VT-AL", result["districts"])
-
-        # Verify the representatives
-        vt_district = result["districts"]["VT-AL"]
-        self.assertIn("representatives", vt_district)
-        self.assertTrue(
-            any(rep["name"] == "Becca Balint" for rep in vt_district["representatives"])
-        )
-
-        # Verify the senators
-        self.assertIn("senators", vt_district)
-        senator_names = [s["name"] for s in vt_district["senators"]]
-        self.assertIn("Bernie Sanders", senator_names)
-        self.assertIn("Peter Welch", senator_names)
-
-    @patch("python.get_us_district_info_from_address.lookup_divisions")
-    @patch("python.get_us_district_info_from_address.get_api_key")
-    def test_dc_address(self, mock_get_api_key, mock_lookup_divisions):
-        """Test a Washington DC address."""
-        # Mock API key and response
-        mock_get_api_key.return_value = "fake_api_key"
 
-        # Create a mock response for a DC address
+        result = parse_result(mock_response)
+
+        districts = result["districts"]
+        self.assertIn("NY-10", districts)
+        self.assertIn("NY-12", districts)
+        self.assertEqual(len(districts["NY-10"]["senators"]), 2)
+        self.assertEqual(districts["NY-10"]["senators"], districts["NY-12"]["senators"])
+        self.assertEqual(districts["NY-10"]["senators"], districts["NY"]["senators"])
+        self.assertEqual(len(districts["NY-12"]["representatives"]), 1)
+
+    def test_parse_result_cached_classification(self):
+        """Test that repeat responses reuse the division classification."""
+        _classify_ocd_ids.cache_clear()
+        with patch(
+            "python.get_us_district_info_from_address._classify_division",
+            wraps=_classify_division,
+        ) as mock_classify:
+            first = parse_result(CA_RESPONSE)
+            classify_calls = mock_classify.call_count
+            second = parse_result(CA_RESPONSE)
+
+        # The second response is classified from the cache
+        self.assertGreater(classify_calls, 0)
+        self.assertEqual(mock_classify.call_count, classify_calls)
+        self.assertEqual(first, second)
+        # Each call still builds its own result
+        first["districts"]["CA-12"]["representatives"].clear()
+        self.assertEqual(len(second["districts"]["CA-12"]["representatives"]), 1)
+
+    def test_extract_congressional_districts(self):
+        """Test that only congressional district divisions are extracted."""
         mock_response = {
             "divisions": {
                 "ocd-division/country:us": {"name": "United States"},
-                "ocd-division/country:us/district:dc": {"name": "District of Columbia"},
+                "ocd-division/country:us/state:ca": {"name": "California"},
+                "ocd-division/country:us/state:ca/cd:12": {
+                    "name": "California's 12th congressional district"
+                },
+                "ocd-division/country:us/state:ca/place:oakland": {"name": "Oakland"},
+                "ocd-division/country:us/state:vt/cd:al": {},
             }
         }
-        mock_lookup_divisions.return_value = mock_response
 
-        # Call the function
-        result = get_us_district_info_from_address(
-            "1600 Pennsylvania Ave, Washington, DC"
+        self.assertEqual(
+            extract_congressional_districts(mock_response),
+            [
+                "California's 12th congressional district",
+                "ocd-division/country:us/state:vt/cd:al",
+            ],
         )
 
-        # Verify the result structure
-        self.assertIn("districts", result)
-        self.assertIn("DC-AL", result["districts"])
-
-        # Verify the delegate
-        dc_district = result["districts"]["DC-AL"]
-        self.assertIn("representatives", dc_district)
-        reps = dc_district["representatives"]
-        self.assertEqual(len(reps), 1)
-        self.assertEqual(reps[0]["name"], "Eleanor Holmes Norton")
-        self.assertEqual(reps[0]["role"], "Delegate (Non-Voting)")
-
-        # DC has no senators
-        self.assertIn("senators", dc_district)
-        self.assertEqual(len(dc_district["senators"]), 0)
-
     def test_filter_legislator_data(self):
         """Test filtering legislator data."""
         # Test data
@@ -183,6 +298,24 @@ class TestGetUSDistrictInfoFromAddress(unittest.TestCase):
         self.assertEqual(reps[0], {"name": "Nancy Pelosi", "party": "Democratic"})
         self.assertNotIn("role", reps[0])
 
+    def test_make_field_filter(self):
+        """Test the keep, delete and pass-through field filters."""
+        senator = {"name": "Alex Padilla", "party": "Democratic", "state": "CA"}
+
+        keep = make_field_filter(keep_fields={"state", "name", "phone"})
+        self.assertEqual(keep(senator), {"name": "Alex Padilla", "state": "CA"})
+        # Kept fields stay in the record's order, not sorted
+        keep = make_field_filter(keep_fields={"bioguide_id", "name"})
+        self.assertEqual(
+            list(keep({"name": "Alex Padilla", "bioguide_id": "P000145"})),
+            ["name", "bioguide_id"],
+        )
+
+        delete = make_field_filter(delete_fields={"party"})
+        self.assertEqual(delete(senator), {"name": "Alex Padilla", "state": "CA"})
+
+        self.assertIs(make_field_filter()(senator), senator)
+
     def test_format_text_output(self):
         """Test formatting data as text."""
         # Test data
@@ -226,6 +359,306 @@ class TestGetUSDistrictInfoFromAddress(unittest.TestCase):
         self.assertIn("Representatives:", text)
         self.assertIn("Nancy Pelosi (Democratic)", text)
 
+    def test_build_legislator_indexes(self):
+        """Test indexing cached legislator data by state and district."""
+        legislators = {
+            "states": {
+                "CA": {
+                    "senators": [
+                        {"full_name": "Alex Padilla", "party": "Democrat"},
+                        {
+                            "full_name": None,
+                            "first_name": "Adam",
+                            "last_name": "Schiff",
+                        },
+                    ]
+                }
+            },
+            "districts": {
+                "CA-12": {"representative": {"full_name": "Lateefah Simon"}},
+                "WY-0": {"representative": {"full_name": "Harriet Hageman"}},
+                # Empty CSV cells are cached as null
+                "NY-10": {
+                    "representative": {
+                        "full_name": None,
+                        "first_name": "Dan",
+                        "last_name": None,
+                    }
+                },
+            },
+        }
+
+        senators_by_state, rep_by_district = build_legislator_indexes(legislators)
+
+        self.assertEqual(
+            senators_by_state["CA"][0].to_dict(),
+            {
+                "name": "Alex Padilla",
+                "party": "Democrat",
+                "role": "Senator",
+                "state": "CA",
+                "bioguide_id": "",
+            },
+        )
+        self.assertEqual(senators_by_state["CA"][1].name, "Adam Schiff")
+        self.assertEqual(senators_by_state["CA"][1].party, "Unknown")
+        self.assertEqual(
+            list(rep_by_district["CA-12"].to_dict().items()),
+            [
+                ("name", "Lateefah Simon"),
+                ("party", "Unknown"),
+                ("role", "Representative"),
+                ("district", "CA-12"),
+                ("bioguide_id", ""),
+            ],
+        )
+        # At-large districts are stored as "ST-0" but looked up as "ST-AL"
+        self.assertEqual(rep_by_district["WY-AL"].name, "Harriet Hageman")
+        self.assertNotIn("WY-0", rep_by_district)
+        self.assertEqual(rep_by_district["NY-10"].name, "Dan")
+        # The shared indexes are read-only
+        self.assertRaises(TypeError, operator.setitem, senators_by_state, "NY", ())
+
+    def test_cached_civic_lookup(self):
+        """Test that repeated lookups are served from the persistent cache."""
+        mock_response = {
+            "divisions": {"ocd-division/country:us/state:ca": {"name": "California"}}
+        }
+        fetch = MagicMock(return_value=mock_response)
+        cached_fetch = cached_civic_lookup(fetch)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "civic_cache.sqlite"
+            with (
+                patch(
+                    "python.get_us_district_info_from_address.CIVIC_CACHE_PATH",
+                    cache_path,
+                ),
+                patch(
+                    "python.get_us_district_info_from_address._civic_cache_conn", None
+                ),
+            ):
+                first = cached_fetch("94110, USA", "fake_api_key")
+                # Normalized address (case and whitespace) should hit the cache
+                second = cached_fetch("  94110, usa ", "fake_api_key")
+
+                # Expired entries are fetched again
+                with patch(
+                    "python.get_us_district_info_from_address.CIVIC_CACHE_TTL", -1
+                ):
+                    cached_fetch("94110, USA", "fake_api_key")
+
+                conn = get_civic_cache()
+                if conn is not None:
+                    conn.close()
+
+        self.assertEqual(first, mock_response)
+        self.assertEqual(second, mock_response)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_read_civic_cache_error(self):
+        """Test that an unreadable response cache is treated as a miss."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "civic_cache.sqlite"
+            # A cache written with an older schema, which has no ts column
+            old_conn = sqlite3.connect(cache_path)
+            old_conn.execute(
+                "CREATE TABLE civic_cache (key TEXT PRIMARY KEY, json BLOB)"
+            )
+            old_conn.close()
+
+            with (
+                patch(
+                    "python.get_us_district_info_from_address.CIVIC_CACHE_PATH",
+                    cache_path,
+                ),
+                patch(
+                    "python.get_us_district_info_from_address._civic_cache_conn", None
+                ),
+            ):
+                with self.assertLogs(level="WARNING"):
+                    self.assertIsNone(read_civic_cache("94110, USA"))
+                conn = get_civic_cache()
+                if conn is not None:
+                    conn.close()
+
+    @patch("python.get_us_district_info_from_address.IJSON_AVAILABLE", False)
+    @patch("python.get_us_district_info_from_address.get_session")
+    def test_lookup_divisions_in_process_cache(self, mock_get_session):
+        """Test that repeat lookups are served in-process until the cache is cleared."""
+        resp = mock_get_session.return_value.get.return_value.__enter__.return_value
+        resp.content = b'{"divisions": {"ocd-division/country:us/state:ca": {}}}'
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "civic_cache.sqlite"
+            with (
+                patch(
+                    "python.get_us_district_info_from_address.CIVIC_CACHE_PATH",
+                    cache_path,
+                ),
+                patch(
+                    "python.get_us_district_info_from_address._civic_cache_conn", None
+                ),
+                patch(
+                    "python.get_us_district_info_from_address.get_civic_cache",
+                    wraps=get_civic_cache,
+                ) as mock_get_civic_cache,
+            ):
+                civic_api_cache_clear()
+                self.addCleanup(_memoized_divisions.cache_clear)
+
+                first = lookup_divisions("94110, USA", "fake_api_key")
+                cache_reads = mock_get_civic_cache.call_count
+                second = lookup_divisions("94110, USA", "fake_api_key")
+                # The second lookup does not even read the persistent cache
+                self.assertEqual(mock_get_civic_cache.call_count, cache_reads)
+
+                # Once the cache period has passed, the persistent cache is read
+                with patch(
+                    "python.get_us_district_info_from_address._cache_period",
+                    return_value=_cache_period() + 1,
+                ):
+                    lookup_divisions("94110, USA", "fake_api_key")
+                self.assertGreater(mock_get_civic_cache.call_count, cache_reads)
+
+                civic_api_cache_clear()
+                lookup_divisions("94110, USA", "fake_api_key")
+                conn = get_civic_cache()
+                if conn is not None:
+                    conn.close()
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_get_session.return_value.get.call_count, 2)
+
+    @unittest.skipUnless(IJSON_AVAILABLE, "ijson is not installed")
+    @patch(
+        "python.get_us_district_info_from_address.get_civic_cache", return_value=None
+    )
+    @patch("python.get_us_district_info_from_address.get_session")
+    def test_fetch_divisions_streaming(self, mock_get_session, mock_get_civic_cache):
+        """Test that stream-parsing a response matches parsing the whole body."""
+        body = json.dumps(
+            {
+                "normalizedInput": {"zip": "00901"},
+                "divisions": {
+                    "ocd-division/country:us/district:pr": {
+                        "name": "Puerto Rico",
+                        "alsoKnownAs": ["ocd-division/country:us/state:pr"],
+                        "officeIndices": [0, 1.5],
+                    },
+                    "ocd-division/country:us/district:pr/place:san_juan": {
+                        "name": "San Juan, Río Piedras"
+                    },
+                },
+            }
+        ).encode("utf-8")
+        resp = mock_get_session.return_value.get.return_value.__enter__.return_value
+        resp.content = body
+
+        results = {}
+        for streaming in (True, False):
+            resp.raw = io.BytesIO(body)
+            with patch(
+                "python.get_us_district_info_from_address.IJSON_AVAILABLE", streaming
+            ):
+                results[streaming] = _fetch_divisions("00901, USA", "fake_api_key")
+
+        self.assertEqual(results[True], {"divisions": json.loads(body)["divisions"]})
+        self.assertEqual(results[True]["divisions"], results[False]["divisions"])
+        # Numbers are read as floats rather than Decimal, so the result serializes
+        puerto_rico = results[True]["divisions"]["ocd-division/country:us/district:pr"]
+        self.assertIsInstance(puerto_rico["officeIndices"][1], float)
+
+    @unittest.skipUnless(HTTPX_AVAILABLE, "httpx is not installed")
+    def test_lookup_divisions_many_async(self):
+        """Test concurrent lookups skip cached addresses and survive failures."""
+        import httpx
+
+        requested = []
+
+        def handler(request):
+            address = request.url.params["address"]
+            requested.append(address)
+            if address == "bad address":
+                return httpx.Response(400, json={"error": "Failed to parse address"})
+            return httpx.Response(200, json={"divisions": {address: {}}})
+
+        async def lookup(addresses):
+            transport = httpx.MockTransport(handler)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await lookup_divisions_many_async(
+                    addresses, "fake_api_key", client
+                )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "civic_cache.sqlite"
+            with (
+                patch(
+                    "python.get_us_district_info_from_address.CIVIC_CACHE_PATH",
+                    cache_path,
+                ),
+                patch(
+                    "python.get_us_district_info_from_address._civic_cache_conn", None
+                ),
+            ):
+                first = asyncio.run(lookup(["94110, USA", "bad address"]))
+                second = asyncio.run(lookup(["94110, USA", "10001, USA"]))
+                conn = get_civic_cache()
+                if conn is not None:
+                    conn.close()
+
+        self.assertEqual(first, [{"divisions": {"94110, USA": {}}}, None])
+        self.assertEqual(second[1], {"divisions": {"10001, USA": {}}})
+        # The cached address is not requested a second time
+        self.assertEqual(requested, ["94110, USA", "bad address", "10001, USA"])
+
+    @unittest.skipUnless(HTTPX_AVAILABLE, "httpx is not installed")
+    def test_lookup_divisions_many_async_concurrency(self):
+        """Test that concurrent lookups are capped at max_concurrency."""
+        import httpx
+
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"divisions": {}})
+
+        async def lookup(addresses):
+            transport = httpx.MockTransport(handler)
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await lookup_divisions_many_async(
+                    addresses, "fake_api_key", client, max_concurrency=3
+                )
+
+        addresses = [f"{zip_code}, USA" for zip_code in range(10001, 10011)]
+        with patch(
+            "python.get_us_district_info_from_address.get_civic_cache",
+            return_value=None,
+        ):
+            results = asyncio.run(lookup(addresses))
+
+        self.assertEqual(results, [{"divisions": {}}] * len(addresses))
+        self.assertEqual(peak, 3)
+
+    def test_json_dumps(self):
+        """Test compact and pretty JSON output."""
+        data = {"districts": {"PR-AL": {"name": "Pablo José Hernández"}}}
+
+        compact = json_dumps(data)
+        pretty = json_dumps(data, pretty=True)
+
+        self.assertEqual(json.loads(compact), data)
+        self.assertEqual(json.loads(pretty), data)
+        self.assertNotIn("\n", compact)
+        self.assertIn('\n  "districts"', pretty)
+        # Non-ASCII names are preserved rather than escaped
+        self.assertIn("Pablo José Hernández", compact)
+
 
 if __name__ == "__main__":
     unittest.main()
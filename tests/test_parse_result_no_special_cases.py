@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for parse_result_no_special_cases.py
+"""
+
+import os
+import sys
+import unittest
+
+# Add parent directory to path to import the module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from python import get_us_district_info_from_address as main_parser
+from python import parse_result_no_special_cases as generic_parser
+from python.parse_result_no_special_cases import parse_result
+
+# Legislator data in the shape written by update_us_congressional_data.py, which
+# stores at-large districts as "ST-0"
+CACHED_LEGISLATORS = {
+    "states": {
+        "CA": {
+            "senators": [
+                {"full_name": "Alex Padilla", "party": "Democratic"},
+                {"full_name": "Laphonza R. Butler", "party": "Democratic"},
+            ]
+        },
+        "VT": {
+            "senators": [
+                {"full_name": "Bernie Sanders", "party": "Independent"},
+                {"full_name": "Peter Welch", "party": "Democratic"},
+            ]
+        },
+    },
+    "districts": {
+        "CA-12": {
+            "representative": {"full_name": "Nancy Pelosi", "party": "Democratic"}
+        },
+        "VT-0": {"representative": {"first_name": "Becca", "last_name": "Balint"}},
+        "DC-0": {
+            "representative": {
+                "full_name": "Eleanor Holmes Norton",
+                "party": "Democratic",
+            }
+        },
+    },
+}
+
+
+class TestParseResultNoSpecialCases(unittest.TestCase):
+    """Test the generic divisionsByAddress parser."""
+
+    def test_congressional_district(self):
+        """Test that a district gets its representative and the state's senators."""
+        data = {
+            "divisions": {
+                "ocd-division/country:us": {"name": "United States"},
+                "ocd-division/country:us/state:ca": {"name": "California"},
+                "ocd-division/country:us/state:ca/cd:12": {"name": "CA-12"},
+                "ocd-division/country:us/state:ca/county:san_francisco": {},
+            }
+        }
+
+        districts = parse_result(data, CACHED_LEGISLATORS)["districts"]
+
+        # State entries are not part of the output
+        self.assertEqual(list(districts), ["CA-12"])
+        representative = districts["CA-12"]["representatives"][0]
+        self.assertEqual(representative["name"], "Nancy Pelosi")
+        self.assertEqual(representative["role"], "Representative")
+        self.assertEqual(
+            [s["name"] for s in districts["CA-12"]["senators"]],
+            ["Alex Padilla", "Laphonza R. Butler"],
+        )
+
+    def test_at_large_state(self):
+        """Test that a state with no numbered district gets an at-large entry."""
+        data = {"divisions": {"ocd-division/country:us/state:vt": {"name": "Vermont"}}}
+
+        districts = parse_result(data, CACHED_LEGISLATORS)["districts"]
+
+        self.assertEqual(list(districts), ["VT-AL"])
+        self.assertEqual(
+            districts["VT-AL"]["representatives"][0]["name"], "Becca Balint"
+        )
+        self.assertEqual(
+            [s["name"] for s in districts["VT-AL"]["senators"]],
+            ["Bernie Sanders", "Peter Welch"],
+        )
+
+    def test_at_large_district_division(self):
+        """Test that a cd:al division does not duplicate the representative."""
+        data = {
+            "divisions": {
+                "ocd-division/country:us/state:vt": {"name": "Vermont"},
+                "ocd-division/country:us/state:vt/cd:al": {"name": "VT-AL"},
+            }
+        }
+
+        districts = parse_result(data, CACHED_LEGISLATORS)["districts"]
+
+        self.assertEqual(
+            [r["name"] for r in districts["VT-AL"]["representatives"]], ["Becca Balint"]
+        )
+
+    def test_territory(self):
+        """Test that a territory gets a non-voting member and no senators."""
+        data = {
+            "divisions": {
+                "ocd-division/country:us/district:dc": {"name": "DC"},
+                "ocd-division/country:us/district:pr": {"name": "Puerto Rico"},
+            }
+        }
+
+        districts = parse_result(data, CACHED_LEGISLATORS)["districts"]
+
+        self.assertEqual(districts["DC-AL"]["senators"], [])
+        delegate = districts["DC-AL"]["representatives"][0]
+        self.assertEqual(delegate["name"], "Eleanor Holmes Norton")
+        self.assertEqual(delegate["role"], "Delegate (Non-Voting)")
+        commissioner = districts["PR-AL"]["representatives"][0]
+        self.assertEqual(commissioner["role"], "Resident Commissioner (Non-Voting)")
+
+    def test_placeholders_without_cached_data(self):
+        """Test placeholder legislators when there is no cached data."""
+        data = {
+            "divisions": {
+                "ocd-division/country:us/state:ny/cd:10": {"name": "NY-10"},
+                "ocd-division/country:us/state:ny/cd:12": {"name": "NY-12"},
+            }
+        }
+
+        districts = parse_result(data, {})["districts"]
+
+        self.assertEqual(list(districts), ["NY-10", "NY-12"])
+        self.assertEqual(
+            districts["NY-10"]["representatives"][0]["name"],
+            "Representative for NY-10",
+        )
+        self.assertEqual(
+            [s["name"] for s in districts["NY-12"]["senators"]],
+            ["Senator 1 for NY", "Senator 2 for NY"],
+        )
+
+    def test_district_keys_match_main_parser(self):
+        """Test that both parsers accept the same OCD IDs and key them alike."""
+        self.assertEqual(generic_parser._OCD_RE.pattern, main_parser._OCD_RE.pattern)
+        self.assertEqual(generic_parser._TERRITORIES, main_parser._TERRITORIES)
+
+        ocd_ids = (
+            "ocd-division/country:us/state:ca/cd:12",
+            "ocd-division/country:us/state:NY/cd:10",
+            "ocd-division/country:us/state:vt/cd:al",
+            "ocd-division/country:us/district:dc",
+            "ocd-division/country:us/district:pr",
+            "ocd-division/country:us/cd:5",
+            "ocd-division/country:us/state:ca/cd:12/place:sf",
+            "ocd-division/country:us/state:tx/cd:1_a",
+            "ocd-division/country:us/district:abc",
+        )
+        for ocd_id in ocd_ids:
+            with self.subTest(ocd_id=ocd_id):
+                (classified,) = main_parser._classify_ocd_ids((ocd_id,))
+                expected = [classified[2]] if classified else []
+                data = {"divisions": {ocd_id: {}}}
+                self.assertEqual(list(parse_result(data, {})["districts"]), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,21 +3,34 @@
 Tests for update_us_congressional_data.py
 """
 
+import io
 import json
 import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from typing import Any, Dict, Tuple
 from unittest.mock import MagicMock, patch
 
+try:
+    import pandas as pd
+
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 # Add parent directory to path to import the module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from python.update_us_congressional_data import (
+    atomic_write,
     build_legislators_dict,
+    dump_json,
     filter_fields,
     get_current_congress_legislators,
+    read_rows,
+    write_json,
 )
 
 
@@ -29,7 +42,14 @@ class TestUpdateUSCongressionalData(unittest.TestCase):
         """Test that the legislators data is fetched and cached correctly."""
         # Mock response
         mock_response = MagicMock()
-        mock_response.content = b"first_name,last_name,state,district\nNancy,Pelosi,CA,12\nAlex,Padilla,CA,\nChuck,Schumer,NY,"
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"abc123"'}
+        mock_response.content = (
+            b"first_name,last_name,state,district\n"
+            b"Nancy,Pelosi,CA,12\n"
+            b"Alex,Padilla,CA,\n"
+            b"Chuck,Schumer,NY,"
+        )
         mock_get.return_value = mock_response
 
         # Create a temporary directory for the test
@@ -37,30 +57,65 @@ class TestUpdateUSCongressionalData(unittest.TestCase):
             temp_path = Path(temp_dir)
 
             # Call function with the temp directory
-            df = get_current_congress_legislators(csv_dir=temp_path)
+            rows = get_current_congress_legislators(csv_dir=temp_path)
 
             # Verify the CSV file was created
             csv_path = temp_path / "legislators-current.csv"
             self.assertTrue(csv_path.exists())
 
-            # Verify the DataFrame has the expected content
-            self.assertEqual(len(df), 3)
-            self.assertTrue("Pelosi" in df["last_name"].values)
-            self.assertTrue("Padilla" in df["last_name"].values)
-            self.assertTrue("Schumer" in df["last_name"].values)
+            # Verify the rows have the expected content
+            self.assertEqual(len(rows), 3)
+            last_names = [row["last_name"] for row in rows]
+            self.assertEqual(last_names, ["Pelosi", "Padilla", "Schumer"])
+            # Empty fields are read as None
+            self.assertEqual(rows[0]["district"], "12")
+            self.assertIsNone(rows[1]["district"])
 
             # Call the function again - it should use cached data
             mock_get.reset_mock()
-            df2 = get_current_congress_legislators(csv_dir=temp_path)
+            get_current_congress_legislators(csv_dir=temp_path)
 
             # Verify the request was not made again
             mock_get.assert_not_called()
 
+            # Only the kept columns and those needed to build the dict are read
+            rows = get_current_congress_legislators(
+                csv_dir=temp_path, keep_fields={"last_name"}
+            )
+            self.assertEqual(list(rows[0]), ["last_name", "state", "district"])
+
+    @patch("python.update_us_congressional_data.requests.get")
+    def test_get_current_congress_legislators_not_modified(self, mock_get):
+        """Test that an expired CSV is revalidated with a conditional GET."""
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_get.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            csv_path = temp_path / "legislators-current.csv"
+            csv_path.write_text(
+                "first_name,last_name,state,district\nNancy,Pelosi,CA,12\n"
+            )
+            (temp_path / "legislators-current.headers.json").write_text(
+                json.dumps({"ETag": '"abc123"'})
+            )
+            # Make the cached copy older than 24 hours
+            os.utime(csv_path, (0, 0))
+
+            rows = get_current_congress_legislators(csv_dir=temp_path)
+
+            self.assertEqual(
+                mock_get.call_args.kwargs["headers"], {"If-None-Match": '"abc123"'}
+            )
+            # The cached copy is kept and its timestamp refreshed
+            self.assertEqual([row["last_name"] for row in rows], ["Pelosi"])
+            self.assertGreater(csv_path.stat().st_mtime, 0)
+
+    @unittest.skipUnless(PANDAS_AVAILABLE, "pandas is not installed")
     def test_build_legislators_dict(self):
         """Test that the legislators dictionary is built correctly."""
         # Create a test DataFrame
-        import pandas as pd
-
         df = pd.DataFrame(
             {
                 "first_name": ["Nancy", "Alex", "Chuck", "Harriet"],
@@ -87,8 +142,58 @@ class TestUpdateUSCongressionalData(unittest.TestCase):
         # Check districts (representatives)
         self.assertIn("CA-12", result["districts"])
         self.assertIn("WY-0", result["districts"])
-        self.assertEqual(result["districts"]["CA-12"]["representative"]["last_name"], "Pelosi")
-        self.assertEqual(result["districts"]["WY-0"]["representative"]["last_name"], "Hageman")
+        self.assertEqual(
+            result["districts"]["CA-12"]["representative"]["last_name"], "Pelosi"
+        )
+        self.assertEqual(
+            result["districts"]["WY-0"]["representative"]["last_name"], "Hageman"
+        )
+
+        # Missing fields are None rather than NaN, so they serialize as null
+        self.assertIsNone(result["states"]["CA"]["senators"][0]["district"])
+
+        # Filtering out the key columns does not affect how rows are grouped
+        result = build_legislators_dict(df, keep_fields={"last_name"})
+        self.assertEqual(
+            result["districts"]["CA-12"]["representative"], {"last_name": "Pelosi"}
+        )
+        result = build_legislators_dict(df, delete_fields={"state", "district"})
+        self.assertEqual(
+            result["states"]["NY"]["senators"],
+            [{"first_name": "Chuck", "last_name": "Schumer"}],
+        )
+
+    def test_build_legislators_dict_from_rows(self):
+        """Test building the dictionary from CSV rows."""
+        rows = [
+            {"last_name": "Pelosi", "state": "CA", "district": "12"},
+            {"last_name": "Padilla", "state": "CA", "district": None},
+            {"last_name": "Hageman", "state": "WY", "district": "0"},
+        ]
+
+        result = build_legislators_dict(rows, delete_fields={"district"})
+
+        self.assertEqual(
+            result["states"]["CA"]["senators"],
+            [{"last_name": "Padilla", "state": "CA"}],
+        )
+        self.assertEqual(list(result["districts"]), ["CA-12", "WY-0"])
+
+    def test_read_rows(self):
+        """Test that blank lines and short rows are read without errors."""
+        lines = io.StringIO(
+            "last_name,state,district\nPelosi,CA,12\n\nPadilla,CA\n\n", newline=""
+        )
+
+        rows = read_rows(lines)
+
+        self.assertEqual(
+            rows,
+            [
+                {"last_name": "Pelosi", "state": "CA", "district": "12"},
+                {"last_name": "Padilla", "state": "CA", "district": None},
+            ],
+        )
 
     def test_filter_fields(self):
         """Test the field filtering functionality."""
@@ -116,6 +221,51 @@ class TestUpdateUSCongressionalData(unittest.TestCase):
         filtered = filter_fields(row)
         self.assertEqual(filtered, row)
 
+    def test_atomic_write(self):
+        """Test that a failed write leaves the previous file in place."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "legislators-lookup.json"
+            with atomic_write(path) as fp:
+                fp.write(b"old")
+
+            with self.assertRaises(RuntimeError):
+                with atomic_write(path) as fp:
+                    fp.write(b"partial")
+                    raise RuntimeError("interrupted")
+
+            self.assertEqual(path.read_bytes(), b"old")
+            self.assertEqual(os.listdir(temp_dir), [path.name])
+
+    def test_dump_json(self):
+        """Test that the legislators dictionary is written as indented JSON."""
+        data = {"districts": {"PR-AL": {"representative": {"last_name": "Hernández"}}}}
+
+        output = dump_json(data)
+
+        self.assertEqual(json.loads(output), data)
+        self.assertTrue(output.startswith(b'{\n  "districts"'))
+
+    def test_write_json(self):
+        """Test that streaming the JSON gives the same output as dump_json."""
+        data: Dict[str, Dict[str, Any]] = {
+            "states": {"CA": {"senators": [{"last_name": "Padilla"}, {}]}},
+            "districts": {
+                "CA-12": {"representative": {"last_name": "Pelosi", "district": 12}},
+                "PR-0": {"representative": {"last_name": "Hernández"}},
+            },
+        }
+
+        cases: Tuple[Dict[str, Dict[str, Any]], ...] = (
+            data,
+            {"states": {}, "districts": {}},
+            {},
+        )
+        for value in cases:
+            with self.subTest(value=value):
+                fp = io.BytesIO()
+                write_json(value, fp)
+                self.assertEqual(fp.getvalue(), dump_json(value))
+
 
 if __name__ == "__main__":
     unittest.main()
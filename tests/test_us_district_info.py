@@ -1,12 +1,40 @@
+import asyncio
 import os
 import sys
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Add the parent directory to the path so we can import the module
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from python.get_us_district_info_from_address import get_us_district_info_from_address
+from python.get_us_district_info_from_address import (
+    HTTP_POOL_SIZE,
+    Representative,
+    Senator,
+    get_us_district_info_from_address,
+    get_us_district_info_from_addresses,
+    get_us_district_info_from_addresses_async,
+    load_zip_districts,
+    lookup_zip_code_state,
+)
+
+CA_SENATORS = (
+    Senator(name="Alex Padilla", party="Democratic", state="CA"),
+    Senator(name="Adam Schiff", party="Democratic", state="CA"),
+)
+
+# A response that mimics the structure from the Google Civic API
+CA12_RESPONSE = {
+    "divisions": {
+        "ocd-division/country:us/state:ca/cd:12": {
+            "name": "California's 12th congressional district"
+        },
+        "ocd-division/country:us/state:ca": {"name": "California"},
+    }
+}
 
 
 class TestUSDistrictInfo(unittest.TestCase):
@@ -19,16 +47,7 @@ class TestUSDistrictInfo(unittest.TestCase):
         # Mock the API key and response
         mock_get_api_key.return_value = "fake_api_key"
 
-        # Create a mock response that mimics the structure from the Google Civic API
-        mock_response = {
-            "divisions": {
-                "ocd-division/country:us/state:ca/cd:12": {
-                    "name": "California's 12th congressional district"
-                },
-                "ocd-division/country:us/state:ca": {"name": "California"},
-            }
-        }
-        mock_lookup_divisions.return_value = mock_response
+        mock_lookup_divisions.return_value = CA12_RESPONSE
 
         # Call the function with a test address
         result = get_us_district_info_from_address("123 Main St, San Francisco, CA")
@@ -55,6 +74,152 @@ class TestUSDistrictInfo(unittest.TestCase):
             self.assertIsNotNone(result.get("error"))
             self.assertEqual(result.get("districts"), {})
 
+    @patch("python.get_us_district_info_from_address.HTTPX_AVAILABLE", False)
+    @patch("python.get_us_district_info_from_address.lookup_divisions")
+    @patch("python.get_us_district_info_from_address.get_api_key")
+    def test_batch_address_lookup(self, mock_get_api_key, mock_lookup_divisions):
+        """Test that batch lookups return one result per address, in order."""
+        mock_get_api_key.return_value = "fake_api_key"
+
+        responses = {
+            "Address in CA-12, USA": {
+                "divisions": {
+                    "ocd-division/country:us/state:ca/cd:12": {"name": "CA-12"},
+                }
+            },
+            "Address in NY-10, USA": {
+                "divisions": {
+                    "ocd-division/country:us/state:ny/cd:10": {"name": "NY-10"},
+                }
+            },
+        }
+        mock_lookup_divisions.side_effect = lambda address, key: responses[address]
+
+        results = get_us_district_info_from_addresses(
+            ["Address in CA-12", "Address in NY-10"], max_workers=2
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertIn("CA-12", results[0]["districts"])
+        self.assertIn("NY-10", results[1]["districts"])
+        self.assertEqual(get_us_district_info_from_addresses([]), [])
+
+    @patch("python.get_us_district_info_from_address.HTTPX_AVAILABLE", True)
+    @patch("python.get_us_district_info_from_address.lookup_divisions")
+    @patch("python.get_us_district_info_from_address.lookup_divisions_many_async")
+    @patch("python.get_us_district_info_from_address.get_api_key")
+    def test_batch_address_lookup_async(
+        self, mock_get_api_key, mock_lookup_many, mock_lookup_divisions
+    ):
+        """Test that batch lookups use the concurrent fetcher when httpx is present."""
+        mock_get_api_key.return_value = "fake_api_key"
+        mock_lookup_many.side_effect = AsyncMock(
+            return_value=[
+                {"divisions": {"ocd-division/country:us/state:ca/cd:12": {}}},
+                {"divisions": {"ocd-division/country:us/state:ny/cd:10": {}}},
+            ]
+        )
+
+        results = get_us_district_info_from_addresses(
+            ["Address in CA-12", "Address in NY-10", "Address in CA-12"]
+        )
+
+        # Duplicate addresses are fetched once
+        mock_lookup_many.assert_called_once_with(
+            ["Address in CA-12, USA", "Address in NY-10, USA"],
+            "fake_api_key",
+            max_concurrency=HTTP_POOL_SIZE,
+        )
+        mock_lookup_divisions.assert_not_called()
+        self.assertEqual(
+            [list(result["districts"]) for result in results],
+            [["CA-12"], ["NY-10"], ["CA-12"]],
+        )
+
+    @patch("python.get_us_district_info_from_address.lookup_divisions")
+    @patch("python.get_us_district_info_from_address.lookup_divisions_many_async")
+    @patch("python.get_us_district_info_from_address.get_api_key")
+    def test_batch_address_lookup_coroutine(
+        self, mock_get_api_key, mock_lookup_many, mock_lookup_divisions
+    ):
+        """Test the batch lookup coroutine from inside a running event loop."""
+        mock_get_api_key.return_value = "fake_api_key"
+        mock_lookup_many.side_effect = AsyncMock(
+            return_value=[
+                {"divisions": {"ocd-division/country:us/state:ca/cd:12": {}}},
+                None,  # A failed lookup
+            ]
+        )
+
+        results = asyncio.run(
+            get_us_district_info_from_addresses_async(
+                ["Address in CA-12", "Bad address"], max_concurrency=4
+            )
+        )
+
+        mock_lookup_many.assert_called_once_with(
+            ["Address in CA-12, USA", "Bad address, USA"],
+            "fake_api_key",
+            max_concurrency=4,
+        )
+        # Addresses that failed in the batch are not retried one at a time
+        mock_lookup_divisions.assert_not_called()
+        self.assertEqual(list(results[0]["districts"]), ["CA-12"])
+        self.assertEqual(results[1]["districts"], {})
+        self.assertIn("error", results[1])
+
+    @patch("python.get_us_district_info_from_address.lookup_divisions")
+    @patch(
+        "python.get_us_district_info_from_address._SENATORS_BY_STATE",
+        MappingProxyType({"CA": CA_SENATORS}),
+    )
+    def test_zip_code_senators_only(self, mock_lookup_divisions):
+        """Test that a senators-only ZIP lookup is answered without the Civic API."""
+        result = get_us_district_info_from_address("94110", senators_only=True)
+
+        mock_lookup_divisions.assert_not_called()
+        senator_names = [s["name"] for s in result["districts"]["CA"]["senators"]]
+        self.assertEqual(senator_names, ["Alex Padilla", "Adam Schiff"])
+        self.assertEqual(result["districts"]["CA"]["representatives"], [])
+
+    @patch("python.get_us_district_info_from_address.lookup_divisions")
+    @patch(
+        "python.get_us_district_info_from_address._SENATORS_BY_STATE",
+        MappingProxyType({"CA": CA_SENATORS}),
+    )
+    @patch(
+        "python.get_us_district_info_from_address._REP_BY_DISTRICT",
+        MappingProxyType(
+            {"CA-11": Representative(name="Nancy Pelosi", district="CA-11")}
+        ),
+    )
+    def test_zip_code_single_district(self, mock_lookup_divisions):
+        """Test that a ZIP code inside one district is answered from cached data."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            zip_path = Path(temp_dir) / "zip-to-cd.csv"
+            zip_path.write_text(
+                "zip,state,cd\n94110,CA,11\n94566,CA,14\n94566,CA,10\n"
+                # Malformed rows are skipped
+                ",CA,12\nn/a,CA,12\n94105\n"
+            )
+
+            with patch(
+                "python.get_us_district_info_from_address.ZIP_TO_CD_PATH", zip_path
+            ):
+                load_zip_districts.cache_clear()
+                lookup_zip_code_state.cache_clear()
+                self.addCleanup(load_zip_districts.cache_clear)
+                self.addCleanup(lookup_zip_code_state.cache_clear)
+
+                result = get_us_district_info_from_address("94110")
+                self.assertEqual(lookup_zip_code_state("94566"), "CA")
+                self.assertEqual(len(load_zip_districts()[0]), 3)
+
+        mock_lookup_divisions.assert_not_called()
+        district = result["districts"]["CA-11"]
+        self.assertEqual(district["representatives"][0]["name"], "Nancy Pelosi")
+        self.assertEqual(len(district["senators"]), 2)
+
 
 if __name__ == "__main__":
     unittest.main()